@@ -0,0 +1,56 @@
+"""
+Quick script to check what columns exist in the podcast tables.
+Uses a single information_schema query for all tables.
+"""
+
+import asyncio
+import os
+from collections import defaultdict
+import asyncpg
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TABLES_TO_CHECK = ["episodes", "podcasts", "episode_topics", "sources", "fact_checks"]
+
+
+async def check_schema():
+    """Print the columns of every table in TABLES_TO_CHECK."""
+    print("=" * 80)
+    print("📊 CHECKING TABLE SCHEMAS")
+    print("=" * 80)
+    
+    conn = await asyncpg.connect(os.getenv("DATABASE_URL"), statement_cache_size=0)
+    try:
+        rows = await conn.fetch(
+            "SELECT table_name, column_name, is_nullable, data_type "
+            "FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = ANY($1) "
+            "ORDER BY table_name, ordinal_position",
+            TABLES_TO_CHECK
+        )
+    finally:
+        await conn.close()
+    
+    columns_by_table = defaultdict(list)
+    for row in rows:
+        columns_by_table[row["table_name"]].append(row)
+    
+    for table_name in TABLES_TO_CHECK:
+        columns = columns_by_table.get(table_name)
+        if not columns:
+            print(f"\n❌ {table_name} - not found")
+            continue
+        
+        print(f"\n✅ {table_name} ({len(columns)} columns)")
+        print("-" * 40)
+        for column in columns:
+            nullable = "NULL" if column["is_nullable"] == "YES" else "NOT NULL"
+            print(f"  - {column['column_name']}: {column['data_type']} {nullable}")
+        print("-" * 40)
+    
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    asyncio.run(check_schema())
@@ -4,24 +4,107 @@ Handles message processing, memory integration, and search decisions.
 """
 
 import asyncio
-from typing import Optional, Dict, Any
-from clean_agent.services.supabase_client import SupabaseClient
+import re
+from typing import Optional, Dict, Any, AsyncIterator
 from clean_agent.services.memory_service import MemoryService
 from clean_agent.services.claude_service import ClaudeService
 from clean_agent.services.search_adapter import SearchAdapter
 
 
+# Keywords that suggest the user needs current information
+SEARCH_KEYWORDS = [
+    "current", "latest", "recent", "today", "now", "what's happening",
+    "news", "update", "price", "weather", "stock", "crypto"
+]
+
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency, falls back to the regex below
+    ahocorasick = None
+
+_SEARCH_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, SEARCH_KEYWORDS)) + r")\b",
+    re.IGNORECASE
+)
+
+
+def _build_search_automaton():
+    """Build an Aho-Corasick automaton over SEARCH_KEYWORDS."""
+    automaton = ahocorasick.Automaton()
+    for keyword in SEARCH_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_SEARCH_AUTOMATON = _build_search_automaton() if ahocorasick else None
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character."""
+    return char.isalnum() or char == "_"
+
+
+def _contains_search_keyword(message: str) -> bool:
+    """
+    Check whether a message contains a whole-word search keyword.
+    
+    Scans the message once with the Aho-Corasick automaton when available.
+    
+    Args:
+        message: The user's message
+        
+    Returns:
+        True if any keyword appears as a whole word
+    """
+    if _SEARCH_AUTOMATON is None:
+        return _SEARCH_RE.search(message) is not None
+    
+    text = message.lower()
+    last = len(text) - 1
+    for end, keyword in _SEARCH_AUTOMATON.iter(text):
+        start = end - len(keyword) + 1
+        if (start == 0 or not _is_word_char(text[start - 1])) and \
+                (end == last or not _is_word_char(text[end + 1])):
+            return True
+    return False
+
+
+_shared_services: Dict[type, Any] = {}
+
+
+def _shared(service_cls: type) -> Any:
+    """Return the process-wide instance of a service class, creating it on first use."""
+    if service_cls not in _shared_services:
+        _shared_services[service_cls] = service_cls()
+    return _shared_services[service_cls]
+
+
 class CleanAgent:
     """
     Main orchestrator that coordinates between Claude, Supabase memory, and search.
     """
     
-    def __init__(self):
-        """Initialize the clean agent with all required services."""
-        self.supabase_client = SupabaseClient()
-        self.memory_service = MemoryService(self.supabase_client)
-        self.claude_service = ClaudeService()
-        self.search_adapter = SearchAdapter()
+    def __init__(
+        self,
+        memory_service: Optional[MemoryService] = None,
+        claude_service: Optional[ClaudeService] = None,
+        search_adapter: Optional[SearchAdapter] = None
+    ):
+        """
+        Initialize the clean agent with all required services.
+        
+        Services that are not passed in default to process-wide shared
+        instances, so agents never build their own clients.
+        
+        Args:
+            memory_service: Optional memory service override
+            claude_service: Optional Claude service override
+            search_adapter: Optional search adapter override
+        """
+        self.memory_service = memory_service or _shared(MemoryService)
+        self.claude_service = claude_service or _shared(ClaudeService)
+        self.search_adapter = search_adapter or _shared(SearchAdapter)
         
     async def process_message(self, message: str, user_id: str = "default") -> str:
         """
@@ -34,13 +117,32 @@ class CleanAgent:
         Returns:
             The agent's response
         """
-        try:
-            # Store the user message in memory
-            await self.memory_service.store_message(user_id, "user", message)
+        chunks = [text async for text in self.stream_message(message, user_id)]
+        return "".join(chunks)
+    
+    async def stream_message(self, message: str, user_id: str = "default") -> AsyncIterator[str]:
+        """
+        Process a user message and stream the agent's response.
+        
+        The user message is stored before Claude is called, and whatever was
+        streamed of the reply is stored when the stream ends - including when
+        the client disconnects or Claude fails partway.
+        
+        Args:
+            message: The user's message
+            user_id: User identifier for memory storage
             
-            # Get relevant conversation history
+        Yields:
+            Chunks of the agent's response
+        """
+        chunks = []
+        try:
+            # Get relevant conversation history, before this turn is added to it
             history = await self.memory_service.get_recent_messages(user_id, limit=10)
             
+            # Queue the user message for a batched write
+            await self.memory_service.store_message(user_id, "user", message)
+            
             # Check if we need to perform a search
             needs_search = await self._should_search(message, history)
             
@@ -49,22 +151,26 @@ class CleanAgent:
             if needs_search:
                 search_results = await self.search_adapter.search(message)
             
-            # Generate response using Claude
-            response = await self.claude_service.generate_response(
+            # Stream the response from Claude
+            async for text in self.claude_service.stream_response(
                 message=message,
                 history=history,
                 search_results=search_results
-            )
-            
-            # Store the agent's response in memory
-            await self.memory_service.store_message(user_id, "assistant", response)
-            
-            return response
+            ):
+                chunks.append(text)
+                yield text
             
         except Exception as e:
             error_msg = f"Error processing message: {str(e)}"
             print(error_msg)
-            return "I apologize, but I encountered an error processing your request."
+            # Don't append an apology to a reply that is already partly sent
+            if not chunks:
+                yield "I apologize, but I encountered an error processing your request."
+        
+        finally:
+            # Runs on client disconnect too (the generator is closed mid-stream)
+            if chunks:
+                await self.memory_service.store_message(user_id, "assistant", "".join(chunks))
     
     async def _should_search(self, message: str, history: list) -> bool:
         """
@@ -77,14 +183,8 @@ class CleanAgent:
         Returns:
             True if search is needed, False otherwise
         """
-        # Simple heuristic: check for keywords that suggest need for current information
-        search_keywords = [
-            "current", "latest", "recent", "today", "now", "what's happening",
-            "news", "update", "price", "weather", "stock", "crypto"
-        ]
-        
-        message_lower = message.lower()
-        return any(keyword in message_lower for keyword in search_keywords)
+        # Local keyword heuristic - no extra Claude call on the hot path
+        return _contains_search_keyword(message)
     
     async def get_conversation_history(self, user_id: str, limit: int = 20) -> list:
         """
@@ -110,3 +210,7 @@ class CleanAgent:
             True if successful, False otherwise
         """
         return await self.memory_service.clear_user_messages(user_id)
+    
+    async def close(self):
+        """Flush pending writes and release background resources."""
+        await self.memory_service.close()
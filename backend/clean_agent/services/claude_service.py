@@ -3,8 +3,39 @@ Claude service for chat and search functionality.
 """
 
 import os
-from typing import List, Dict, Any, Optional
-from anthropic import Anthropic
+import logging
+import warnings
+from typing import List, Dict, Any, AsyncIterator, Optional
+import anthropic
+import backoff
+from anthropic import AsyncAnthropic
+from .rate_limiter import RateLimiter
+from .search_router import SearchRouter
+
+logger = logging.getLogger(__name__)
+
+# Haiku answers the common case; Sonnet is reserved for long or search-grounded turns
+DEFAULT_MODEL = "claude-3-5-haiku-20241022"
+LARGE_MODEL = "claude-sonnet-4-20250514"
+LARGE_MODEL_MESSAGE_CHARS = 2000
+
+UNAVAILABLE_MESSAGE = "I'm sorry, but I'm not available right now. Please check my configuration."
+
+# Rough characters-per-token ratio used to budget requests before sending
+CHARS_PER_TOKEN = 4
+
+
+# Static preamble sent with every request. It is not marked for prompt caching:
+# at roughly 80 tokens it is far below the minimum cacheable prefix (1024 tokens
+# on Sonnet/Opus, 2048 on Haiku), so a cache_control breakpoint would be ignored
+BASE_SYSTEM_PROMPT = """You are a helpful AI assistant. You can engage in conversation, answer questions, and provide information based on your knowledge and any search results provided.
+
+Guidelines:
+- Be helpful, accurate, and concise
+- If search results are provided, use them to inform your response
+- If you don't know something, say so rather than guessing
+- Maintain a friendly and professional tone
+"""
 
 
 class ClaudeService:
@@ -12,19 +43,28 @@ class ClaudeService:
     Service for interacting with Claude API for chat and reasoning.
     """
     
-    def __init__(self):
-        """Initialize the Claude service."""
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the Claude service.
+        
+        Args:
+            rate_limiter: Optional shared limiter; a new one is created if omitted
+        """
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
         self.client = None
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.search_router = SearchRouter()
         
         if self.api_key:
             try:
-                self.client = Anthropic(api_key=self.api_key)
-                print("Claude service initialized successfully")
+                # SDK retries off: _create_message's backoff is the only retry
+                # layer, so every attempt goes through the rate limiter
+                self.client = AsyncAnthropic(api_key=self.api_key, max_retries=0)
+                logger.info("Claude service initialized successfully")
             except Exception as e:
-                print(f"Error initializing Claude service: {e}")
+                logger.error("Error initializing Claude service: %s", e)
         else:
-            print("Warning: ANTHROPIC_API_KEY not found in environment variables")
+            logger.warning("ANTHROPIC_API_KEY not found in environment variables")
     
     def is_available(self) -> bool:
         """Check if Claude service is available."""
@@ -34,85 +74,190 @@ class ClaudeService:
         self, 
         message: str, 
         history: List[Dict[str, Any]] = None,
-        search_results: Optional[str] = None
+        search_results: Optional[str] = None,
+        model: Optional[str] = None
     ) -> str:
         """
-        Generate a response using Claude.
+        Generate a complete response using Claude.
         
         Args:
             message: The user's current message
             history: Previous conversation history
             search_results: Optional search results to include in context
+            model: Model override; chosen from the message when omitted
             
         Returns:
             Claude's response
         """
         if not self.is_available():
-            return "I'm sorry, but I'm not available right now. Please check my configuration."
+            return UNAVAILABLE_MESSAGE
         
         try:
-            # Build the conversation context
-            messages = []
+            chunks = [
+                text async for text in self.stream_response(message, history, search_results, model)
+            ]
+            return "".join(chunks)
             
-            # Add conversation history
-            if history:
-                for msg in history:
-                    messages.append({
-                        "role": msg.get("role", "user"),
-                        "content": msg.get("content", "")
-                    })
+        except Exception as e:
+            logger.error("Error generating Claude response: %s", e)
+            return "I apologize, but I encountered an error while processing your request."
+    
+    async def stream_response(
+        self, 
+        message: str, 
+        history: List[Dict[str, Any]] = None,
+        search_results: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from Claude as text chunks.
+        
+        Args:
+            message: The user's current message
+            history: Previous conversation history
+            search_results: Optional search results to include in context
+            model: Model override; chosen from the message when omitted
             
-            # Add current message
-            messages.append({
-                "role": "user",
-                "content": message
-            })
+        Yields:
+            Text chunks as Claude produces them
             
-            # Build system prompt
-            system_prompt = self._build_system_prompt(search_results)
+        Raises:
+            anthropic.APIError: If the request fails
+        """
+        if not self.is_available():
+            yield UNAVAILABLE_MESSAGE
+            return
+        
+        # Build the conversation context
+        messages = []
+        
+        # Add conversation history
+        if history:
+            for msg in history:
+                messages.append({
+                    "role": msg.get("role", "user"),
+                    "content": msg.get("content", "")
+                })
+        
+        # Add current message
+        messages.append({
+            "role": "user",
+            "content": message
+        })
+        
+        # Build system prompt
+        system_prompt = self._build_system_prompt(search_results)
+        
+        # Make the API call
+        stream = await self._create_message(
+            model=model or self._select_model(message, search_results),
+            max_tokens=1000,
+            system=system_prompt,
+            messages=messages,
+            stream=True
+        )
+        
+        async for event in stream:
+            if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                yield event.delta.text
+    
+    @staticmethod
+    def _select_model(message: str, search_results: Optional[str] = None) -> str:
+        """
+        Pick the model for a turn.
+        
+        Args:
+            message: The user's current message
+            search_results: Optional search results included in context
             
-            # Make the API call
-            response = self.client.messages.create(
-                model="claude-3-5-haiku-20241022",
-                max_tokens=1000,
-                system=system_prompt,
-                messages=messages
-            )
+        Returns:
+            LARGE_MODEL for long messages or search-grounded answers, else DEFAULT_MODEL
+        """
+        if search_results or len(message) > LARGE_MODEL_MESSAGE_CHARS:
+            return LARGE_MODEL
+        return DEFAULT_MODEL
+    
+    @backoff.on_exception(
+        backoff.expo,
+        anthropic.RateLimitError,
+        max_tries=3,
+        factor=1,
+        max_value=60
+    )
+    async def _create_message(self, **params) -> Any:
+        """
+        Send a messages.create request within the rate limit budget.
+        
+        Rate-limited (429) responses are retried with exponential backoff.
+        With stream=True the request is sent (and retried) before the first
+        event is returned.
+        
+        Args:
+            **params: Keyword arguments for messages.create
             
-            return response.content[0].text
+        Returns:
+            The Anthropic message response, or an event stream when stream=True
+        """
+        await self.rate_limiter.acquire(self._estimate_tokens(params))
+        return await self.client.messages.create(**params)
+    
+    @staticmethod
+    def _estimate_tokens(params: Dict[str, Any]) -> int:
+        """
+        Estimate the tokens a request will use (input plus max output).
+        
+        Args:
+            params: Keyword arguments for messages.create
             
-        except Exception as e:
-            print(f"Error generating Claude response: {e}")
-            return "I apologize, but I encountered an error while processing your request."
+        Returns:
+            Estimated token count
+        """
+        chars = 0
+        system = params.get("system") or []
+        if isinstance(system, str):
+            chars += len(system)
+        else:
+            chars += sum(len(block.get("text", "")) for block in system)
+        for msg in params.get("messages", []):
+            content = msg.get("content", "")
+            chars += len(content) if isinstance(content, str) else len(str(content))
+        
+        return chars // CHARS_PER_TOKEN + params.get("max_tokens", 0)
     
-    def _build_system_prompt(self, search_results: Optional[str] = None) -> str:
+    def _build_system_prompt(self, search_results: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Build the system prompt for Claude.
         
+        The static guidelines go in their own block; search results follow
+        in a separate block.
+        
         Args:
             search_results: Optional search results to include
             
         Returns:
-            System prompt string
+            List of system prompt content blocks
         """
-        base_prompt = """You are a helpful AI assistant. You can engage in conversation, answer questions, and provide information based on your knowledge and any search results provided.
-
-Guidelines:
-- Be helpful, accurate, and concise
-- If search results are provided, use them to inform your response
-- If you don't know something, say so rather than guessing
-- Maintain a friendly and professional tone
-"""
+        blocks = [{
+            "type": "text",
+            "text": BASE_SYSTEM_PROMPT
+        }]
         
         if search_results:
-            base_prompt += f"\n\nSearch Results:\n{search_results}\n\nUse these search results to provide accurate, up-to-date information when relevant."
+            blocks.append({
+                "type": "text",
+                "text": f"Search Results:\n{search_results}\n\nUse these search results to provide accurate, up-to-date information when relevant."
+            })
         
-        return base_prompt
+        return blocks
     
     async def analyze_search_need(self, message: str, history: List[Dict[str, Any]] = None) -> bool:
         """
         Analyze whether a message requires live search.
         
+        Deprecated: nothing calls this any more. CleanAgent decides with its
+        local keyword check (agent_core._contains_search_keyword); use that,
+        or SearchRouter.needs_search directly. Will be removed.
+        
         Args:
             message: The user's message
             history: Previous conversation history
@@ -120,32 +265,13 @@ Guidelines:
         Returns:
             True if search is recommended, False otherwise
         """
-        if not self.is_available():
-            return False
-        
+        warnings.warn(
+            "ClaudeService.analyze_search_need is deprecated; use SearchRouter.needs_search",
+            DeprecationWarning,
+            stacklevel=2
+        )
         try:
-            analysis_prompt = f"""
-Analyze the following user message and determine if it requires live search for current information.
-
-User message: "{message}"
-
-Consider:
-- Does the user need current/recent information?
-- Are they asking about news, prices, weather, or other time-sensitive data?
-- Would your existing knowledge be sufficient?
-
-Respond with only "YES" if live search is needed, or "NO" if not needed.
-"""
-            
-            response = self.client.messages.create(
-                model="claude-3-5-haiku-20241022",
-                max_tokens=10,
-                messages=[{"role": "user", "content": analysis_prompt}]
-            )
-            
-            result = response.content[0].text.strip().upper()
-            return result == "YES"
-            
+            return bool(self.search_router.needs_search(message))
         except Exception as e:
-            print(f"Error analyzing search need: {e}")
+            logger.error("Error analyzing search need: %s", e)
             return False
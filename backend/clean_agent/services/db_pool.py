@@ -0,0 +1,66 @@
+"""
+Shared asyncpg connection pool for direct Postgres access.
+"""
+
+import asyncio
+import os
+from typing import Optional
+import asyncpg
+
+
+# Pool sizing for the Supabase Postgres connection. Each uvicorn worker has its
+# own pool, so the server holds up to WEB_CONCURRENCY x these connections
+POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+POOL_MAX_INACTIVE_LIFETIME = 300
+
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+
+async def get_pool() -> Optional[asyncpg.Pool]:
+    """
+    Get the shared connection pool, creating it on first use.
+    
+    Returns:
+        The asyncpg pool, or None if DATABASE_URL is not configured
+        or the pool could not be created
+    """
+    global _pool
+    
+    if _pool is not None:
+        return _pool
+    
+    async with _pool_lock:
+        if _pool is not None:
+            return _pool
+        
+        dsn = os.getenv("DATABASE_URL")
+        if not dsn:
+            print("Warning: DATABASE_URL not found in environment variables")
+            return None
+        
+        try:
+            # Prepared statement cache is disabled for Supavisor (transaction mode) compatibility
+            _pool = await asyncpg.create_pool(
+                dsn,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=POOL_MAX_INACTIVE_LIFETIME,
+                statement_cache_size=0
+            )
+            print("Database pool initialized successfully")
+        except Exception as e:
+            print(f"Error initializing database pool: {e}")
+            _pool = None
+    
+    return _pool
+
+
+async def close_pool():
+    """Close the shared connection pool."""
+    global _pool
+    
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -1,11 +1,32 @@
 """
-Memory service for storing and retrieving chat messages using Supabase.
+Memory service for storing and retrieving chat messages using Postgres.
 """
 
 import asyncio
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from .supabase_client import SupabaseClient
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+import asyncpg
+import backoff
+from .db_pool import get_pool
+
+
+# Composite index expected by get_recent_messages
+# (see backend/migrations/0001_chat_messages_user_created_idx.sql)
+HISTORY_INDEX_NAME = "chat_messages_user_created_idx"
+
+# Bounded so a stalled database applies back-pressure instead of growing memory
+WRITE_QUEUE_MAXSIZE = 10_000
+WRITE_BATCH_SIZE = 100
+
+# A batch insert is retried on these; executemany is atomic (asyncpg >= 0.29),
+# so a failed attempt leaves nothing behind to duplicate
+TRANSIENT_WRITE_ERRORS = (
+    asyncpg.PostgresConnectionError,
+    asyncpg.InsufficientResourcesError,
+    OSError,
+    asyncio.TimeoutError,
+)
+WRITE_MAX_TRIES = 5
 
 
 class MemoryService:
@@ -13,51 +34,175 @@ class MemoryService:
     Service for managing chat message storage and retrieval.
     """
     
-    def __init__(self, supabase_client: SupabaseClient):
+    def __init__(self):
+        """Initialize the memory service."""
+        self.table_name = "chat_messages"
+        self._write_queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+        self._writer_task: Optional[asyncio.Task] = None
+        # Queued-but-unwritten messages per user, so reads can wait for them
+        self._pending: Counter = Counter()
+    
+    async def verify_schema(self) -> bool:
         """
-        Initialize the memory service.
+        Check that the chat history index exists.
         
-        Args:
-            supabase_client: Initialized Supabase client
+        Returns:
+            True if the table and index are present, False otherwise
         """
-        self.supabase_client = supabase_client
-        self.table_name = "chat_messages"
+        pool = await get_pool()
+        if pool is None:
+            return False
+        
+        try:
+            row = await pool.fetchrow(
+                "WITH t AS (SELECT to_regclass($1) IS NOT NULL AS table_exists), "
+                "i AS (SELECT to_regclass($2) IS NOT NULL AS index_exists) "
+                "SELECT table_exists, index_exists FROM t, i",
+                self.table_name, HISTORY_INDEX_NAME
+            )
+            
+            if not row["table_exists"]:
+                print(f"Warning: table {self.table_name} does not exist")
+                return False
+            if not row["index_exists"]:
+                print(f"Warning: index {HISTORY_INDEX_NAME} is missing; history queries will sort per request")
+                return False
+            return True
+            
+        except Exception as e:
+            print(f"Error verifying schema: {e}")
+            return False
     
     async def store_message(self, user_id: str, role: str, content: str) -> bool:
         """
-        Store a chat message in the database.
+        Queue a chat message for storage in the database.
         
         Args:
             user_id: User identifier
             role: Message role (user, assistant, system)
             content: Message content
             
+        Returns:
+            True if the message was queued, False otherwise
+        """
+        return await self.store_messages([(user_id, role, content)])
+    
+    async def store_messages(self, rows: List[Tuple[str, str, str]]) -> bool:
+        """
+        Queue several chat messages for storage in the database.
+        
+        Messages are written by a background task in batches, so callers
+        do not wait on the insert. When the queue is full this waits for
+        room rather than dropping messages.
+        
+        Args:
+            rows: (user_id, role, content) tuples in insertion order
+            
+        Returns:
+            True if the messages were queued, False otherwise
+        """
+        if not rows:
+            return True
+        
+        pool = await get_pool()
+        if pool is None:
+            print("Warning: Database not connected, messages not stored")
+            return False
+        
+        self._ensure_writer()
+        for row in rows:
+            self._pending[row[0]] += 1
+            await self._write_queue.put(row)
+        return True
+    
+    async def flush(self):
+        """Wait until every queued message has been written."""
+        if self._writer_task is not None:
+            await self._write_queue.join()
+    
+    async def close(self):
+        """Flush queued messages and stop the background writer."""
+        await self.flush()
+        
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+    
+    def _ensure_writer(self):
+        """Start the background writer task if it is not running."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+    
+    async def _writer_loop(self):
+        """Drain the write queue, inserting up to WRITE_BATCH_SIZE rows at a time."""
+        while True:
+            rows = [await self._write_queue.get()]
+            while len(rows) < WRITE_BATCH_SIZE and not self._write_queue.empty():
+                rows.append(self._write_queue.get_nowait())
+            
+            try:
+                await self._write_batch(rows)
+            finally:
+                for user_id, _, _ in rows:
+                    self._pending[user_id] -= 1
+                    if self._pending[user_id] <= 0:
+                        del self._pending[user_id]
+                    self._write_queue.task_done()
+    
+    async def _write_batch(self, rows: List[Tuple[str, str, str]]) -> bool:
+        """
+        Insert a batch of chat messages in a single round-trip.
+        
+        Connection drops and resource exhaustion are retried with exponential
+        backoff, up to WRITE_MAX_TRIES attempts, before the batch is dropped.
+        
+        Args:
+            rows: (user_id, role, content) tuples in insertion order
+            
         Returns:
             True if successful, False otherwise
         """
-        if not self.supabase_client.is_connected():
-            print("Warning: Supabase not connected, message not stored")
+        pool = await get_pool()
+        if pool is None:
+            print(f"Warning: Database not connected, dropped {len(rows)} messages")
             return False
         
         try:
-            message_data = {
-                "user_id": user_id,
-                "role": role,
-                "content": content,
-                "created_at": datetime.utcnow().isoformat()
-            }
-            
-            result = self.supabase_client.client.table(self.table_name).insert(message_data).execute()
+            await self._insert_rows(pool, rows)
             return True
             
         except Exception as e:
-            print(f"Error storing message: {e}")
+            print(f"Error storing messages, dropped {len(rows)}: {e}")
             return False
     
+    @backoff.on_exception(
+        backoff.expo,
+        TRANSIENT_WRITE_ERRORS,
+        max_tries=WRITE_MAX_TRIES,
+        max_value=10
+    )
+    async def _insert_rows(self, pool: asyncpg.Pool, rows: List[Tuple[str, str, str]]):
+        """Insert rows with one executemany, retrying transient failures."""
+        # created_at comes from the column default, clock_timestamp(), so rows
+        # in one batch still sort in insertion order
+        # (see backend/migrations/0002_chat_messages_created_at_default.sql)
+        await pool.executemany(
+            f"INSERT INTO {self.table_name} (user_id, role, content) "
+            "VALUES ($1, $2, $3)",
+            rows
+        )
+    
     async def get_recent_messages(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Retrieve recent messages for a user.
         
+        Waits for the user's queued messages to be written first, so a turn
+        stored by the previous request is part of the history.
+        
         Args:
             user_id: User identifier
             limit: Maximum number of messages to retrieve
@@ -65,24 +210,25 @@ class MemoryService:
         Returns:
             List of message dictionaries
         """
-        if not self.supabase_client.is_connected():
-            print("Warning: Supabase not connected, returning empty history")
+        pool = await get_pool()
+        if pool is None:
+            print("Warning: Database not connected, returning empty history")
             return []
         
         try:
-            result = (
-                self.supabase_client.client
-                .table(self.table_name)
-                .select("*")
-                .eq("user_id", user_id)
-                .order("created_at", desc=True)
-                .limit(limit)
-                .execute()
+            if self._pending.get(user_id):
+                await self.flush()
+            
+            # Take the newest rows, then let Postgres return them oldest-first
+            rows = await pool.fetch(
+                "SELECT * FROM ("
+                f"SELECT * FROM {self.table_name} "
+                "WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2"
+                ") recent ORDER BY created_at ASC",
+                user_id, limit
             )
             
-            # Reverse to get chronological order
-            messages = result.data[::-1] if result.data else []
-            return messages
+            return [dict(row) for row in rows]
             
         except Exception as e:
             print(f"Error retrieving messages: {e}")
@@ -98,17 +244,18 @@ class MemoryService:
         Returns:
             True if successful, False otherwise
         """
-        if not self.supabase_client.is_connected():
-            print("Warning: Supabase not connected, cannot clear messages")
+        pool = await get_pool()
+        if pool is None:
+            print("Warning: Database not connected, cannot clear messages")
             return False
         
         try:
-            result = (
-                self.supabase_client.client
-                .table(self.table_name)
-                .delete()
-                .eq("user_id", user_id)
-                .execute()
+            # Make sure queued writes don't land after the delete
+            await self.flush()
+            
+            await pool.execute(
+                f"DELETE FROM {self.table_name} WHERE user_id = $1",
+                user_id
             )
             return True
             
@@ -126,18 +273,16 @@ class MemoryService:
         Returns:
             Number of messages
         """
-        if not self.supabase_client.is_connected():
+        pool = await get_pool()
+        if pool is None:
             return 0
         
         try:
-            result = (
-                self.supabase_client.client
-                .table(self.table_name)
-                .select("id", count="exact")
-                .eq("user_id", user_id)
-                .execute()
+            count = await pool.fetchval(
+                f"SELECT count(*) FROM {self.table_name} WHERE user_id = $1",
+                user_id
             )
-            return result.count or 0
+            return count or 0
             
         except Exception as e:
             print(f"Error getting message count: {e}")
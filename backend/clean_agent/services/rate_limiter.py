@@ -0,0 +1,85 @@
+"""
+Client-side rate limiting for Claude API calls.
+"""
+
+import asyncio
+import time
+
+
+# Default budget, kept below Anthropic's per-minute limits
+DEFAULT_RPM = 40
+DEFAULT_TPM = 16000
+
+
+class TokenBucket:
+    """
+    Token bucket that refills continuously at a fixed rate.
+    """
+    
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            capacity: Maximum number of tokens the bucket holds
+            refill_per_second: Tokens added back per second
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+    
+    async def acquire(self, amount: float = 1.0):
+        """
+        Wait until `amount` tokens are available, then take them.
+        
+        Requests larger than the capacity are clamped so they can still
+        proceed once the bucket is full.
+        
+        Args:
+            amount: Number of tokens to take
+        """
+        amount = min(amount, self.capacity)
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.refill_per_second)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter for Claude calls.
+    """
+    
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rpm: Requests allowed per minute
+            tpm: Tokens allowed per minute
+        """
+        self.requests = TokenBucket(rpm, rpm / 60.0)
+        self.tokens = TokenBucket(tpm, tpm / 60.0)
+    
+    async def acquire(self, estimated_tokens: int):
+        """
+        Wait for budget for one request of the given size.
+        
+        Args:
+            estimated_tokens: Estimated tokens the request will consume
+        """
+        await self.requests.acquire(1)
+        await self.tokens.acquire(estimated_tokens)
@@ -2,10 +2,40 @@
 Search adapter for integrating with live search functionality.
 """
 
-import os
-import sys
-from typing import Optional, Dict, Any
-from pathlib import Path
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+# The live search tool lives in the main project's `tools` package, which
+# must be importable (installed or on PYTHONPATH)
+try:
+    from tools.live_search_tool import LiveSearchTool
+except ImportError as e:
+    print(f"Warning: Could not import live search tool: {e}")
+    print("Search functionality will be limited")
+    LiveSearchTool = None
+
+
+# Formatted results are reused for identical queries within the TTL
+SEARCH_CACHE_MAXSIZE = 1024
+SEARCH_CACHE_TTL = 300  # Seconds
+
+_shared_search_tool = None
+
+
+def _get_shared_search_tool():
+    """Create the live search tool once and reuse it for every adapter."""
+    global _shared_search_tool
+    
+    if _shared_search_tool is None and LiveSearchTool is not None:
+        try:
+            _shared_search_tool = LiveSearchTool()
+            print("Search adapter initialized with live search tool")
+        except Exception as e:
+            print(f"Error initializing search tool: {e}")
+    
+    return _shared_search_tool
 
 
 class SearchAdapter:
@@ -15,29 +45,9 @@ class SearchAdapter:
     
     def __init__(self):
         """Initialize the search adapter."""
-        self.search_tool = None
-        self._initialize_search_tool()
-    
-    def _initialize_search_tool(self):
-        """Initialize the search tool by importing from the existing codebase."""
-        try:
-            # Add the parent directory to the path to import from the main project
-            parent_dir = Path(__file__).parent.parent.parent.parent
-            sys.path.insert(0, str(parent_dir))
-            
-            # Try to import the live search tool
-            from tools.live_search_tool import LiveSearchTool
-            
-            self.search_tool = LiveSearchTool()
-            print("Search adapter initialized with live search tool")
-            
-        except ImportError as e:
-            print(f"Warning: Could not import live search tool: {e}")
-            print("Search functionality will be limited")
-            self.search_tool = None
-        except Exception as e:
-            print(f"Error initializing search tool: {e}")
-            self.search_tool = None
+        self.search_tool = _get_shared_search_tool()
+        self._cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
     
     def is_available(self) -> bool:
         """Check if search functionality is available."""
@@ -47,6 +57,9 @@ class SearchAdapter:
         """
         Perform a live search for the given query.
         
+        Results are cached per query, and concurrent calls for the same
+        query share a single upstream search.
+        
         Args:
             query: Search query string
             
@@ -56,6 +69,35 @@ class SearchAdapter:
         if not self.is_available():
             return "Search functionality is not available."
         
+        cached = self._get_cached(query)
+        if cached is not None:
+            return cached
+        
+        inflight = self._inflight.get(query)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[query] = future
+        try:
+            result = await self._search_and_format(query)
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[query]
+            if not future.done():
+                future.cancel()
+    
+    async def _search_and_format(self, query: str) -> str:
+        """
+        Run the upstream search and format the results, caching successes.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Formatted search results or an error message
+        """
         try:
             # Use the existing search tool
             results = await self.search_tool.cached_search(query)
@@ -65,12 +107,34 @@ class SearchAdapter:
             
             # Format the results for Claude
             formatted_results = self._format_search_results(results)
+            self._set_cached(query, formatted_results)
             return formatted_results
             
         except Exception as e:
             print(f"Error performing search: {e}")
             return f"Search failed: {str(e)}"
     
+    def _get_cached(self, query: str) -> Optional[str]:
+        """Return the cached result for a query if it has not expired."""
+        entry = self._cache.get(query)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.monotonic() - stored_at > SEARCH_CACHE_TTL:
+            del self._cache[query]
+            return None
+        
+        self._cache.move_to_end(query)
+        return value
+    
+    def _set_cached(self, query: str, value: str):
+        """Cache a result, evicting the least recently used entry when full."""
+        self._cache[query] = (time.monotonic(), value)
+        self._cache.move_to_end(query)
+        if len(self._cache) > SEARCH_CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+    
     def _format_search_results(self, results: Dict[str, Any]) -> str:
         """
         Format search results for inclusion in Claude's context.
@@ -84,7 +148,7 @@ class SearchAdapter:
         if not results:
             return "No search results found."
         
-        formatted = "Search Results:\n\n"
+        parts = ["Search Results:\n\n"]
         
         # Handle different result formats
         if isinstance(results, list):
@@ -94,31 +158,29 @@ class SearchAdapter:
                     snippet = result.get('snippet', result.get('description', 'No description'))
                     url = result.get('url', '')
                     
-                    formatted += f"{i}. {title}\n"
-                    formatted += f"   {snippet}\n"
+                    parts.append(f"{i}. {title}\n   {snippet}\n")
                     if url:
-                        formatted += f"   URL: {url}\n"
-                    formatted += "\n"
+                        parts.append(f"   URL: {url}\n")
+                    parts.append("\n")
                 else:
-                    formatted += f"{i}. {str(result)}\n\n"
+                    parts.append(f"{i}. {str(result)}\n\n")
         
         elif isinstance(results, dict):
             # Handle single result or structured data
             if 'title' in results:
-                formatted += f"Title: {results.get('title', 'No title')}\n"
-                formatted += f"Content: {results.get('snippet', results.get('content', 'No content'))}\n"
+                parts.append(f"Title: {results.get('title', 'No title')}\n")
+                parts.append(f"Content: {results.get('snippet', results.get('content', 'No content'))}\n")
                 if 'url' in results:
-                    formatted += f"URL: {results['url']}\n"
+                    parts.append(f"URL: {results['url']}\n")
             else:
                 # Generic dict formatting
-                for key, value in results.items():
-                    formatted += f"{key}: {value}\n"
+                parts.extend(f"{key}: {value}\n" for key, value in results.items())
         
         else:
             # Fallback for other types
-            formatted += str(results)
+            parts.append(str(results))
         
-        return formatted
+        return "".join(parts)
     
     async def test_search(self) -> bool:
         """
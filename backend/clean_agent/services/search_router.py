@@ -0,0 +1,91 @@
+"""
+Local embedding router that decides whether a message needs live search.
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional dependency
+    np = None
+    SentenceTransformer = None
+
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SIMILARITY_THRESHOLD = 0.5
+
+# Example messages that need fresh information
+SEARCH_PROTOTYPES = [
+    "What's the latest news today?",
+    "What is the current stock price?",
+    "What's the weather like right now?",
+    "What happened this week?",
+    "Any recent updates on this story?",
+    "What is the price of bitcoin today?",
+    "Who won the game last night?",
+    "What are the breaking headlines?",
+]
+
+
+class SearchRouter:
+    """
+    Classifies messages by cosine similarity to search prototypes.
+    
+    The model and prototype embeddings load on first use and are shared
+    by every instance in the process.
+    """
+    
+    _model = None
+    _prototypes = None
+    
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        """
+        Initialize the router.
+        
+        Args:
+            threshold: Minimum similarity to a prototype to route to search
+        """
+        self.threshold = threshold
+    
+    def is_available(self) -> bool:
+        """Check if the embedding model can be used."""
+        return SentenceTransformer is not None
+    
+    def _load(self) -> bool:
+        """Load the model and embed the prototypes once per process."""
+        if SearchRouter._model is not None:
+            return True
+        if not self.is_available():
+            return False
+        
+        try:
+            model = SentenceTransformer(EMBEDDING_MODEL)
+            SearchRouter._prototypes = model.encode(
+                SEARCH_PROTOTYPES, normalize_embeddings=True
+            )
+            SearchRouter._model = model
+            logger.info("Search router loaded %s", EMBEDDING_MODEL)
+            return True
+        except Exception as e:
+            logger.error("Error loading search router model: %s", e)
+            return False
+    
+    def needs_search(self, message: str) -> Optional[bool]:
+        """
+        Decide whether a message needs live search.
+        
+        Args:
+            message: The user's message
+            
+        Returns:
+            True or False, or None if the model is unavailable
+        """
+        if not self._load():
+            return None
+        
+        embedding = SearchRouter._model.encode([message], normalize_embeddings=True)[0]
+        return float(np.dot(SearchRouter._prototypes, embedding).max()) > self.threshold
@@ -2,21 +2,47 @@
 Supabase client factory for the clean agent.
 """
 
+import asyncio
 import os
 from typing import Optional
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
+
+
+# Connection pool limits for the shared PostgREST HTTP session
+MAX_CONNECTIONS = 50
+MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_TIMEOUT = 30.0
 
 
 class SupabaseClient:
     """
     Factory class for creating and managing Supabase client connections.
+    
+    Use SupabaseClient.get() to obtain the process-wide instance so every
+    caller shares one pooled HTTP session instead of opening its own.
     """
     
+    _instance: Optional["SupabaseClient"] = None
+    
     def __init__(self):
         """Initialize the Supabase client."""
         self._client: Optional[Client] = None
+        self._http_client: Optional[httpx.Client] = None
         self._initialize_client()
     
+    @classmethod
+    def get(cls) -> "SupabaseClient":
+        """
+        Get the shared Supabase client, creating it on first use.
+        
+        Returns:
+            The process-wide SupabaseClient instance
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def _initialize_client(self):
         """Initialize the Supabase client with environment variables."""
         url = os.getenv("SUPABASE_URL")
@@ -29,7 +55,19 @@ class SupabaseClient:
             return
         
         try:
-            self._client = create_client(url, key)
+            # Keep-alive pool shared by all PostgREST requests from this process
+            self._http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=HTTP_TIMEOUT
+            )
+            self._client = create_client(
+                url,
+                key,
+                options=ClientOptions(httpx_client=self._http_client)
+            )
             print("Supabase client initialized successfully")
         except Exception as e:
             print(f"Error initializing Supabase client: {e}")
@@ -56,8 +94,16 @@ class SupabaseClient:
         
         try:
             # Simple test query
-            result = self._client.table("chat_messages").select("id").limit(1).execute()
+            await asyncio.to_thread(
+                lambda: self._client.table("chat_messages").select("id").limit(1).execute()
+            )
             return True
         except Exception as e:
             print(f"Supabase connection test failed: {e}")
             return False
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        if self._http_client:
+            self._http_client.close()
+            self._http_client = None
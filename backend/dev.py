@@ -0,0 +1,14 @@
+"""
+Development server for the Feedcast API with auto-reload.
+"""
+
+import uvicorn
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        log_level="info"
+    )
@@ -3,9 +3,11 @@ Simple example: Generate a podcast for a user with interests.
 Run this after your FastAPI server is running.
 """
 
-import requests
+import asyncio
+import httpx
 import time
 import os
+from datetime import datetime, timezone
 from supabase import create_client
 from dotenv import load_dotenv
 
@@ -16,13 +18,30 @@ API_URL = "http://localhost:8000"
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 
-def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
+# One Supabase client for the whole script
+SUPABASE = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+# One pooled client for every API call; closed in run()
+_client = httpx.AsyncClient(
+    base_url=API_URL,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=10)
+)
+
+# Poll for the episode with growing gaps instead of a fixed 3-minute wait
+POLL_INITIAL_DELAY = 2.0
+POLL_MAX_DELAY = 15.0
+POLL_BACKOFF = 1.5
+POLL_TIMEOUT = 240
+
+async def generate_podcast_for_user(user_id: str, duration_minutes: int = 5, supabase=SUPABASE):
     """
     Generate a personalized news podcast for a user.
     
     Args:
         user_id: User's UUID from users table
         duration_minutes: Podcast duration (5-30 minutes)
+        supabase: Supabase client to query with
     """
     
     print("=" * 80)
@@ -31,7 +50,6 @@ def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
     
     # Step 1: Verify user and interests
     print("\n📊 Step 1: Checking user and interests...")
-    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
     
     # Check user exists
     user = supabase.table("users").select("email").eq("id", user_id).single().execute()
@@ -46,12 +64,12 @@ def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
     
     if not interests.data:
         print("⚠️  No interests found - adding sample interests...")
-        supabase.table("user_interests").insert([
+        # PostgREST returns the inserted rows, so there's no need to select them again
+        interests = supabase.table("user_interests").insert([
             {"user_id": user_id, "interest": "artificial intelligence", "weight": 10},
             {"user_id": user_id, "interest": "technology", "weight": 8},
             {"user_id": user_id, "interest": "science", "weight": 6}
         ]).execute()
-        interests = supabase.table("user_interests").select("interest, weight").eq("user_id", user_id).execute()
     
     sorted_interests = sorted(interests.data, key=lambda x: x.get('weight', 0), reverse=True)
     top_interests = [i['interest'] for i in sorted_interests[:5]]
@@ -64,14 +82,16 @@ def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
     print(f"\n🚀 Step 2: Calling API to generate {duration_minutes}-minute podcast...")
     print("   (This starts background generation)")
     
+    # Only episodes created after the request count, so an older one can't end the poll early
+    requested_at = datetime.now(timezone.utc).isoformat()
+    
     try:
-        response = requests.post(
-            f"{API_URL}/api/podcasts/generate-news",
+        response = await _client.post(
+            "/api/podcasts/generate-news",
             params={
                 "user_id": user_id,
                 "duration_minutes": duration_minutes
-            },
-            timeout=10
+            }
         )
         
         if response.status_code == 200:
@@ -85,22 +105,31 @@ def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
             print(f"\n⏳ Step 3: Waiting for completion...")
             print("   (Generation takes 2-4 minutes for event discovery)")
             
-            wait_time = 180  # 3 minutes
-            for i in range(wait_time, 0, -30):
-                print(f"   {i}s remaining...", end='\r')
-                time.sleep(30)
+            started = time.monotonic()
+            deadline = started + POLL_TIMEOUT
+            delay = POLL_INITIAL_DELAY
+            user_episodes = []
             
-            print("\n✅ Wait complete! Checking results...")
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                print(f"   {time.monotonic() - started:.0f}s elapsed, checking...", end='\r')
+                
+                # Get latest episode for user via podcast relationship, filtered server-side
+                episodes = await asyncio.to_thread(
+                    lambda: supabase.table("episodes").select(
+                        "id, title, duration, created_at, podcast:podcasts!inner(user_id)"
+                    ).eq("podcast.user_id", user_id).gte("created_at", requested_at)
+                    .order("created_at", desc=True).limit(1).execute()
+                )
+                
+                user_episodes = episodes.data
+                if user_episodes:
+                    break
+                
+                delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
             
             # Step 4: Check results
-            print(f"\n📺 Step 4: Checking for generated episode...")
-            
-            # Get latest episode for user via podcast relationship
-            episodes = supabase.table("episodes").select(
-                "id, title, duration, created_at, podcast:podcasts!inner(user_id)"
-            ).order("created_at", desc=True).limit(5).execute()
-            
-            user_episodes = [e for e in episodes.data if e.get('podcast', {}).get('user_id') == user_id]
+            print(f"\n\n📺 Step 4: Checking for generated episode...")
             
             if user_episodes:
                 episode = user_episodes[0]
@@ -110,17 +139,21 @@ def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
                 print(f"   Duration: {episode['duration']}s")
                 print(f"   Created: {episode['created_at']}")
                 
-                # Get topics
-                topics = supabase.table("episode_topics").select("*").eq("episode_id", episode['id']).execute()
+                # Get topics and sources together - both only need the episode id
+                topics, sources = await asyncio.gather(
+                    asyncio.to_thread(
+                        lambda: supabase.table("episode_topics").select("*").eq("episode_id", episode['id']).execute()
+                    ),
+                    asyncio.to_thread(
+                        lambda: supabase.table("sources").select("title, publication").eq("episode_id", episode['id']).execute()
+                    )
+                )
                 
                 if topics.data:
                     print(f"\n📝 Topics saved ({len(topics.data)} total):")
                     for topic in sorted(topics.data, key=lambda t: t['importance_score'], reverse=True)[:5]:
                         print(f"   - {topic['topic_name']} ({topic['topic_type']}, score: {topic['importance_score']:.1f})")
                 
-                # Get sources
-                sources = supabase.table("sources").select("title, publication").eq("episode_id", episode['id']).execute()
-                
                 if sources.data:
                     print(f"\n📰 Sources used ({len(sources.data)} total):")
                     for source in sources.data[:3]:
@@ -143,7 +176,7 @@ def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
             print(f"   {response.text}")
             return None
             
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("\n❌ Could not connect to API!")
         print("   Make sure your FastAPI server is running:")
         print("   cd /Users/Tim/Desktop/Berkeley/hackathon/feedcast/backend")
@@ -157,12 +190,18 @@ def generate_podcast_for_user(user_id: str, duration_minutes: int = 5):
         return None
 
 
+async def run(user_id: str, duration_minutes: int = 5):
+    """Generate a podcast, then close the shared HTTP client."""
+    try:
+        return await generate_podcast_for_user(user_id, duration_minutes=duration_minutes)
+    finally:
+        await _client.aclose()
+
+
 if __name__ == "__main__":
     # Example: Get first user and generate podcast
-    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
-    
     print("Finding a user to test with...")
-    users = supabase.table("users").select("id, email").limit(5).execute()
+    users = SUPABASE.table("users").select("id, email").limit(5).execute()
     
     if not users.data:
         print("❌ No users found in database!")
@@ -180,7 +219,7 @@ if __name__ == "__main__":
     print(f"   ID: {user_id}")
     
     # Generate 5-minute podcast
-    episode_id = generate_podcast_for_user(user_id, duration_minutes=5)
+    episode_id = asyncio.run(run(user_id, duration_minutes=5))
     
     if episode_id:
         print(f"\n🎊 All done! Episode ID: {episode_id}")
@@ -4,11 +4,16 @@ Integrates all services and provides comprehensive API endpoints.
 """
 
 import os
+import json
+import asyncio
+import time
 import logging
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 from dotenv import load_dotenv
 
@@ -19,10 +24,11 @@ load_dotenv()
 from clean_agent.agent_core import CleanAgent
 from podcast_generation.clean_agent_integration import init_podcast_routes
 from routers.podcast_router import router as podcast_router
-from podcast_generation.claude_service import ClaudePodcastService
-from podcast_generation.fact_checker import FactChecker
-from podcast_generation.generator import PodcastGenerator
+from podcast_generation.claude_service import get_claude_service, shutdown_claude_service
+from podcast_generation.fact_checker import get_fact_checker
+from podcast_generation.generator import PodcastGenerator, get_search_cache, sweep_search_cache, shutdown_search_cache
 from clean_agent.services.supabase_client import SupabaseClient
+from clean_agent.services.db_pool import get_pool, close_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,64 +43,76 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
-# Configure CORS
+# Configure CORS - explicit origins (comma-separated) so browsers can cache preflights
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=os.getenv("FRONTEND_ORIGIN", "http://localhost:3000").split(","),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=600,
 )
 
+# Compress larger JSON responses (e.g. /health)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Global service instances
 agent = None
 claude_service = None
 fact_checker = None
 podcast_generator = None
 supabase_client = None
+cache_sweeper: Optional[asyncio.Task] = None
+
+async def init_clean_agent() -> CleanAgent:
+    """Create the Clean Agent and verify its chat memory schema."""
+    clean_agent = CleanAgent()
+    await clean_agent.memory_service.verify_schema()
+    return clean_agent
+
+def init_supabase_client():
+    """Return the shared Supabase client, or None to run in limited mode."""
+    try:
+        supabase_client_instance = SupabaseClient.get()
+        if not supabase_client_instance.is_connected():
+            logger.warning("Supabase connection failed - running in limited mode")
+            return None
+        return supabase_client_instance.client
+    except Exception as e:
+        logger.warning(f"Supabase initialization failed: {e} - running in limited mode")
+        return None
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    global agent, claude_service, fact_checker, podcast_generator, supabase_client
+    global agent, claude_service, fact_checker, podcast_generator, supabase_client, cache_sweeper
     
     logger.info("Starting up Feedcast Podcast Generation API...")
     
     try:
-        # Initialize Clean Agent
-        logger.info("Initializing Clean Agent...")
-        agent = CleanAgent()
-        
         # Verify Anthropic API key
         anthropic_key = os.getenv("ANTHROPIC_API_KEY")
         if not anthropic_key:
             logger.error("ANTHROPIC_API_KEY environment variable not set")
             raise HTTPException(status_code=500, detail="Anthropic API key not configured")
         
-        # Initialize Supabase client
-        logger.info("Initializing Supabase client...")
-        try:
-            supabase_client_instance = SupabaseClient()
-            if not supabase_client_instance.is_connected():
-                logger.warning("Supabase connection failed - running in limited mode")
-                supabase_client = None
-            else:
-                supabase_client = supabase_client_instance.client
-        except Exception as e:
-            logger.warning(f"Supabase initialization failed: {e} - running in limited mode")
-            supabase_client = None
-        
-        # Initialize Claude service
-        logger.info("Initializing Claude service...")
-        claude_service = ClaudePodcastService(api_key=anthropic_key)
+        # Clean Agent, Supabase and Claude don't depend on each other - initialize them together
+        logger.info("Initializing Clean Agent, Supabase client and Claude service...")
+        agent, supabase_client, claude_service = await asyncio.gather(
+            init_clean_agent(),
+            asyncio.to_thread(init_supabase_client),
+            get_claude_service()
+        )
+        await claude_service.prewarm()
         
         # Initialize Fact Checker
         logger.info("Initializing Fact Checker...")
-        fact_checker = FactChecker(claude_service)
+        fact_checker = await get_fact_checker()
         
         # Initialize Podcast Generator
         logger.info("Initializing Podcast Generator...")
-        podcast_generator = PodcastGenerator(supabase_client, claude_service, fact_checker)
+        podcast_generator = PodcastGenerator(supabase_client, claude_service, fact_checker, get_search_cache())
+        cache_sweeper = asyncio.create_task(sweep_search_cache())
         
         logger.info("All services initialized successfully!")
         
@@ -105,14 +123,40 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
-    global claude_service
+    global agent, claude_service, cache_sweeper
     logger.info("Shutting down Feedcast Podcast Generation API...")
     
     if claude_service:
         try:
-            await claude_service.close()
+            await shutdown_claude_service()
+            claude_service = None
         except Exception as e:
             logger.warning(f"Error closing Claude service: {e}")
+    
+    if cache_sweeper:
+        cache_sweeper.cancel()
+        cache_sweeper = None
+    
+    try:
+        await shutdown_search_cache()
+    except Exception as e:
+        logger.warning(f"Error closing search cache: {e}")
+    
+    if agent:
+        try:
+            await agent.close()
+        except Exception as e:
+            logger.warning(f"Error closing Clean Agent: {e}")
+    
+    try:
+        await close_pool()
+    except Exception as e:
+        logger.warning(f"Error closing database pool: {e}")
+    
+    try:
+        SupabaseClient.get().close()
+    except Exception as e:
+        logger.warning(f"Error closing Supabase client: {e}")
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -139,84 +183,215 @@ async def root():
         }
     }
 
-@app.post("/chat")
-async def chat(message: str):
-    """Process a chat message."""
+def get_agent() -> CleanAgent:
+    """Get the shared Clean Agent instance."""
     if not agent:
         raise HTTPException(status_code=500, detail="Clean Agent not initialized")
+    return agent
+
+@app.post("/chat")
+async def chat(message: str, clean_agent: CleanAgent = Depends(get_agent)):
+    """Process a chat message, streaming the reply as server-sent events."""
+    async def events():
+        # stream_message yields an apology itself if generation fails
+        async for chunk in clean_agent.stream_message(message):
+            yield f"data: {json.dumps({'delta': chunk})}\n\n"
+    
+    # identity encoding keeps GZipMiddleware from buffering the event stream
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Content-Encoding": "identity"}
+    )
+
+# Liveness/readiness endpoint for orchestrators - no I/O
+@app.get("/healthz")
+async def healthz():
+    """Report whether startup has finished, without touching any dependency."""
+    return {"status": "ok" if agent and claude_service else "starting"}
+
+# Enhanced health check endpoint
+# Monitors poll /health constantly; run the expensive probes at most once per TTL
+HEALTH_PROBE_TTL = 60
+_anthropic_health = {"ts": 0.0, "result": None}
+_tables_health = {"ts": 0.0, "result": None}
+
+async def check_anthropic_health() -> Dict[str, Any]:
+    """Return the Anthropic API status, reusing the last probe for HEALTH_PROBE_TTL seconds."""
+    if not claude_service:
+        return {
+            "status": "unhealthy",
+            "message": "Claude service not initialized"
+        }
+    
+    now = time.monotonic()
+    if _anthropic_health["result"] is not None and now - _anthropic_health["ts"] < HEALTH_PROBE_TTL:
+        return _anthropic_health["result"]
     
     try:
-        response = await agent.process_message(message)
-        return {"response": response}
+        # Test Claude API with the smallest possible request
+        test_response = await claude_service.generate_completion(
+            messages=[{"role": "user", "content": "Hello"}],
+            max_tokens=1,
+            use_cache=False
+        )
+        result = {
+            "status": "healthy",
+            "message": "Anthropic API accessible",
+            "test_response_length": len(test_response)
+        }
     except Exception as e:
-        logger.error(f"Chat processing error: {str(e)}")
-        return {"error": str(e)}
+        result = {
+            "status": "unhealthy",
+            "message": f"Anthropic API test failed: {str(e)}"
+        }
+    
+    _anthropic_health["ts"] = now
+    _anthropic_health["result"] = result
+    return result
+
+# Database probes use the asyncpg pool so they never block the event loop;
+# without DATABASE_URL they fall back to the REST client on a worker thread
+async def probe_users_table():
+    """Read one row from users, raising if the database is unreachable."""
+    pool = await get_pool()
+    if pool:
+        await pool.fetchval("SELECT id FROM users LIMIT 1")
+    else:
+        await asyncio.to_thread(lambda: supabase_client.table("users").select("id").limit(1).execute())
+
+async def probe_tables(table_names: List[str]) -> Dict[str, bool]:
+    """
+    Check which tables are readable in one round trip.
+    
+    Successful results are reused for HEALTH_PROBE_TTL seconds.
+    
+    Args:
+        table_names: Tables to probe
+        
+    Returns:
+        Mapping of table name to readability (see migrations/0003_health_tables_rpc.sql)
+    """
+    now = time.monotonic()
+    if _tables_health["result"] is not None and now - _tables_health["ts"] < HEALTH_PROBE_TTL:
+        return _tables_health["result"]
+    
+    pool = await get_pool()
+    if pool:
+        result = json.loads(await pool.fetchval("SELECT health_tables($1::text[])", table_names))
+    else:
+        response = await asyncio.to_thread(
+            lambda: supabase_client.rpc("health_tables", {"table_names": table_names}).execute()
+        )
+        result = response.data or {}
+    
+    _tables_health["ts"] = now
+    _tables_health["result"] = result
+    return result
+
+async def check_supabase_health() -> Dict[str, Any]:
+    """Return the database connection status."""
+    if not supabase_client:
+        return {
+            "status": "unhealthy",
+            "message": "Supabase client not initialized"
+        }
+    
+    try:
+        # Test database connection
+        await probe_users_table()
+        return {
+            "status": "healthy",
+            "message": "Database connection successful",
+            "tables_accessible": True
+        }
+    except Exception as e:
+        return {
+            "status": "unhealthy",
+            "message": f"Database connection failed: {str(e)}",
+            "tables_accessible": False
+        }
+
+async def check_tables_health() -> Optional[Dict[str, Any]]:
+    """Return the required tables' status, or None when there is no database to check."""
+    if not supabase_client:
+        return None
+    
+    try:
+        required_tables = ["users", "podcasts", "sources", "fact_checks", "user_interests", "interactive_elements"]
+        
+        accessible = await probe_tables(required_tables)
+        table_status = {
+            table: "accessible" if accessible.get(table) else "error: not accessible"
+            for table in required_tables
+        }
+        
+        return {
+            "status": "healthy" if all(status == "accessible" for status in table_status.values()) else "partial",
+            "tables": table_status
+        }
+    except Exception as e:
+        return {
+            "status": "unhealthy",
+            "message": f"Table check failed: {str(e)}"
+        }
+
+# One slow dependency shouldn't hold up the whole health response
+HEALTH_PROBE_TIMEOUT = 2.0
+
+async def run_health_probe(name: str, probe) -> Optional[Dict[str, Any]]:
+    """
+    Await a health probe, reporting it unhealthy if it exceeds HEALTH_PROBE_TIMEOUT.
+    
+    Args:
+        name: Dependency name used in the timeout message
+        probe: Awaitable returning the service's status dict
+        
+    Returns:
+        The probe's status dict, or an unhealthy status on timeout
+    """
+    try:
+        return await asyncio.wait_for(probe, timeout=HEALTH_PROBE_TIMEOUT)
+    except asyncio.TimeoutError:
+        return {
+            "status": "unhealthy",
+            "message": f"{name} check timed out after {HEALTH_PROBE_TIMEOUT}s"
+        }
 
-# Enhanced health check endpoint
 @app.get("/health")
-async def health_check():
-    """Comprehensive health check for all services."""
+async def health_check(shallow: bool = False):
+    """
+    Comprehensive health check for all services.
+    
+    Args:
+        shallow: Skip the dependency probes and report only startup state
+    """
     health_status = {
         "status": "healthy",
-        "timestamp": "2024-01-01T00:00:00Z",  # Will be updated below
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "services": {}
     }
     
+    if shallow:
+        health_status["status"] = "healthy" if agent and claude_service else "starting"
+        return health_status
+    
     try:
-        from datetime import datetime
-        health_status["timestamp"] = datetime.utcnow().isoformat()
-        
         # Check Clean Agent
         health_status["services"]["clean_agent"] = {
             "status": "healthy" if agent else "unhealthy",
             "message": "Clean Agent initialized" if agent else "Clean Agent not initialized"
         }
         
-        # Check Supabase connection
-        if supabase_client:
-            try:
-                # Test database connection
-                result = supabase_client.table("users").select("id").limit(1).execute()
-                health_status["services"]["supabase"] = {
-                    "status": "healthy",
-                    "message": "Database connection successful",
-                    "tables_accessible": True
-                }
-            except Exception as e:
-                health_status["services"]["supabase"] = {
-                    "status": "unhealthy",
-                    "message": f"Database connection failed: {str(e)}",
-                    "tables_accessible": False
-                }
-        else:
-            health_status["services"]["supabase"] = {
-                "status": "unhealthy",
-                "message": "Supabase client not initialized"
-            }
+        # The dependency probes are independent, so run them side by side
+        supabase_health, anthropic_health, tables_health = await asyncio.gather(
+            run_health_probe("Database", check_supabase_health()),
+            run_health_probe("Anthropic API", check_anthropic_health()),
+            run_health_probe("Table", check_tables_health())
+        )
         
-        # Check Anthropic API
-        if claude_service:
-            try:
-                # Test Claude API with a simple request
-                test_response = await claude_service.generate_completion(
-                    messages=[{"role": "user", "content": "Hello"}],
-                    max_tokens=10
-                )
-                health_status["services"]["anthropic"] = {
-                    "status": "healthy",
-                    "message": "Anthropic API accessible",
-                    "test_response_length": len(test_response)
-                }
-            except Exception as e:
-                health_status["services"]["anthropic"] = {
-                    "status": "unhealthy",
-                    "message": f"Anthropic API test failed: {str(e)}"
-                }
-        else:
-            health_status["services"]["anthropic"] = {
-                "status": "unhealthy",
-                "message": "Claude service not initialized"
-            }
+        health_status["services"]["supabase"] = supabase_health
+        health_status["services"]["anthropic"] = anthropic_health
         
         # Check Fact Checker
         health_status["services"]["fact_checker"] = {
@@ -231,27 +406,8 @@ async def health_check():
         }
         
         # Check database tables
-        if supabase_client:
-            try:
-                required_tables = ["users", "podcasts", "sources", "fact_checks", "user_interests", "interactive_elements"]
-                table_status = {}
-                
-                for table in required_tables:
-                    try:
-                        supabase_client.table(table).select("id").limit(1).execute()
-                        table_status[table] = "accessible"
-                    except Exception as e:
-                        table_status[table] = f"error: {str(e)}"
-                
-                health_status["services"]["database_tables"] = {
-                    "status": "healthy" if all(status == "accessible" for status in table_status.values()) else "partial",
-                    "tables": table_status
-                }
-            except Exception as e:
-                health_status["services"]["database_tables"] = {
-                    "status": "unhealthy",
-                    "message": f"Table check failed: {str(e)}"
-                }
+        if tables_health:
+            health_status["services"]["database_tables"] = tables_health
         
         # Overall status
         all_healthy = all(
@@ -266,7 +422,7 @@ async def health_check():
         logger.error(f"Health check failed: {str(e)}")
         return {
             "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "error": str(e)
         }
 
@@ -277,10 +433,14 @@ init_podcast_routes(app)
 app.include_router(podcast_router, prefix="/api")
 
 if __name__ == "__main__":
+    # Production server; use dev.py for auto-reload during development
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        # "auto" picks uvloop/httptools when installed; uvloop isn't on Windows
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
         log_level="info"
     )
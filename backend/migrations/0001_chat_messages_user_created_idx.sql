@@ -0,0 +1,18 @@
+-- ============================================================================
+-- CHAT MESSAGES HISTORY INDEX
+-- Run in Supabase SQL Editor (outside a transaction - CONCURRENTLY requires it)
+-- ============================================================================
+
+-- Serves MemoryService.get_recent_messages:
+--   WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2
+-- as an index range scan instead of sorting all of a user's messages.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS chat_messages_user_created_idx
+  ON public.chat_messages (user_id, created_at DESC);
+
+-- The composite index covers lookups by user_id alone
+DROP INDEX CONCURRENTLY IF EXISTS idx_chat_messages_user_id;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'chat_messages';
@@ -0,0 +1,18 @@
+-- ============================================================================
+-- CHAT MESSAGES TIMESTAMP DEFAULT
+-- Run in Supabase SQL Editor
+-- ============================================================================
+
+-- MemoryService no longer sends created_at; the database stamps each row.
+-- clock_timestamp(), not now(): now() is the transaction start time, and
+-- MemoryService inserts a whole batch (a turn's user and assistant messages
+-- included) in one executemany transaction, so every row would get the same
+-- created_at and history ordered by it would come back shuffled.
+ALTER TABLE public.chat_messages
+  ALTER COLUMN created_at SET DEFAULT clock_timestamp();
+
+-- Verify
+SELECT column_name, column_default
+FROM information_schema.columns
+WHERE table_name = 'chat_messages'
+AND column_name = 'created_at';
@@ -0,0 +1,31 @@
+-- ============================================================================
+-- HEALTH CHECK TABLE PROBE
+-- Run in Supabase SQL Editor
+-- ============================================================================
+
+-- Lets /health check every required table in one round trip:
+--   supabase.rpc("health_tables", {"table_names": [...]})
+-- Returns {"<table>": true|false} - false when the table is missing or unreadable.
+CREATE OR REPLACE FUNCTION public.health_tables(table_names text[])
+RETURNS jsonb
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+  t text;
+  result jsonb := '{}'::jsonb;
+BEGIN
+  FOREACH t IN ARRAY table_names LOOP
+    BEGIN
+      EXECUTE format('SELECT 1 FROM public.%I LIMIT 1', t);
+      result := result || jsonb_build_object(t, true);
+    EXCEPTION WHEN OTHERS THEN
+      result := result || jsonb_build_object(t, false);
+    END;
+  END LOOP;
+  RETURN result;
+END;
+$$;
+
+-- Verify
+SELECT public.health_tables(ARRAY['users', 'podcasts']);
@@ -0,0 +1,19 @@
+-- ============================================================================
+-- EPISODES LATEST-PER-PODCAST INDEX
+-- Run in Supabase SQL Editor (outside a transaction - CONCURRENTLY requires it)
+-- ============================================================================
+
+-- Serves "latest episodes for a user's podcasts":
+--   episodes JOIN podcasts ON podcast_id WHERE podcasts.user_id = $1
+--   ORDER BY episodes.created_at DESC LIMIT n
+-- podcasts(user_id) is already covered by idx_podcasts_user_id.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS episodes_podcast_created_idx
+  ON public.episodes (podcast_id, created_at DESC);
+
+-- The composite index covers lookups by podcast_id alone
+DROP INDEX CONCURRENTLY IF EXISTS idx_episodes_podcast_id;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'episodes';
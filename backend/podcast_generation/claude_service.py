@@ -3,19 +3,374 @@ Claude API service wrapper for podcast generation with web search capabilities.
 """
 
 import os
+import re
+import html
+import json
+import time
+import random
 import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional, Any
+import functools
+import contextlib
+from collections import OrderedDict, Counter
+from typing import List, Dict, Optional, Any, Tuple, Union, AsyncIterator, Callable, Awaitable, TypedDict
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 import httpx
-from anthropic import Anthropic
+import anthropic
+from anthropic import AsyncAnthropic
 from anthropic.types import Message
 import backoff
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from .rate_limiter import RateLimiter
+from .types import VerificationStatus
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional dependency; falls back to regex stripping
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; falls back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Identical searches, completions and page fetches are served from memory within the TTL
+RESPONSE_CACHE_MAXSIZE = 1024
+RESPONSE_CACHE_TTL = 3600  # Seconds
+FETCH_CACHE_TTL = 600  # Seconds; fetched pages go stale faster than searches
+
+# web_fetch reads at most this much of a page body before extracting text
+FETCH_MAX_BYTES = 256 * 1024
+FETCH_CHUNK_SIZE = 16 * 1024
+
+# Bodies larger than this are decoded and stripped in a worker thread, off the event loop
+FETCH_OFFLOAD_BYTES = 64 * 1024
+
+# Media types web_fetch extracts text from; anything else is rejected before reading the body
+FETCH_MARKUP_TYPES = {"text/html", "application/xhtml+xml", "application/xml", "text/xml"}
+FETCH_JSON_TYPES = {"application/json", "application/ld+json"}
+FETCH_PLAIN_TYPES = {"text/plain", "text/markdown"}
+
+# Connection pool for web fetches; search fan-out reuses connections to the same hosts
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=30.0)
+# Page fetches only; Anthropic calls go through the SDK's own client with API_TIMEOUT
+HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=5.0)
+
+# Compressed bodies httpx can decode; br needs the brotli package (zstd needs httpx>=0.27.1)
+FETCH_ACCEPT_ENCODING = "gzip, deflate, br"
+
+# web_fetch_many concurrency: overall, and per origin so no single site is hammered
+FETCH_CONCURRENCY = 16
+FETCH_PER_HOST_CONCURRENCY = 4
+
+# Anthropic calls can generate for minutes (server-side web search, long scripts)
+API_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# Client-side budget for the podcast pipeline's API calls, below Anthropic's per-minute limits
+API_RPM = 50
+API_TPM = 80000
+CHARS_PER_TOKEN = 4  # Rough ratio used to budget requests before sending
+
+# Only transient failures are retried; other 4xx responses fail fast
+RETRYABLE_HTTP_ERRORS = (httpx.TransportError, httpx.HTTPStatusError)
+RETRYABLE_API_ERRORS = (anthropic.APIConnectionError, anthropic.APIStatusError)
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+RETRY_MAX_DELAY = 60.0  # Seconds; caps both backoff and server Retry-After hints
+RETRY_JITTER = 0.25  # Seconds of random delay added to each retry
+RATE_LIMIT_RESET_HEADERS = (
+    "anthropic-ratelimit-requests-reset",
+    "anthropic-ratelimit-tokens-reset",
+)
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """
+    Decide whether a failed request should not be retried.
+    
+    Args:
+        error: Exception raised by an httpx or Anthropic request
+        
+    Returns:
+        True for client errors (4xx) other than timeouts, conflicts and rate limits
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+    else:
+        status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        return False
+    return 400 <= status_code < 500 and status_code not in RETRYABLE_STATUS_CODES
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the server's requested retry delay from a failed response.
+    
+    Args:
+        error: Exception raised by an httpx or Anthropic request
+        
+    Returns:
+        Seconds to wait from Retry-After (seconds or HTTP date) or an Anthropic
+        rate limit reset timestamp, or None if the response carries no hint
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    
+    now = datetime.now(timezone.utc)
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(retry_after) - now).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    
+    for header in RATE_LIMIT_RESET_HEADERS:
+        reset = response.headers.get(header)
+        if reset:
+            try:
+                reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            return max(0.0, (reset_at - now).total_seconds())
+    
+    return None
+
+
+def retry_after_expo(base: float = 2, factor: float = 1, max_value: float = RETRY_MAX_DELAY):
+    """
+    backoff wait generator: exponential delays stretched to the server's hint.
+    
+    backoff sends each caught exception into the generator, so a 429 or 503
+    with Retry-After waits as long as the server asked instead of retrying early.
+    """
+    error = yield
+    attempt = 0
+    while True:
+        delay = factor * base ** attempt
+        hint = retry_after_seconds(error)
+        if hint is not None:
+            delay = max(delay, hint)
+        attempt += 1
+        error = yield min(delay, max_value) + random.uniform(0, RETRY_JITTER)
+
+
+def pause_on_rate_limit(details: Dict[str, Any]) -> None:
+    """backoff on_backoff handler: hold every API call until a 429 window ends."""
+    error = details.get("exception")
+    if getattr(error, "status_code", None) == 429:
+        details["args"][0]._pause_requests(details["wait"])
+
+# Prompt templates, built once at import and filled in per request with str.format.
+# Static instructions come first so Anthropic can serve them from the prompt cache.
+PODCAST_PRODUCER_PROMPT = """You are a professional podcast producer creating podcast episodes.
+
+Create a comprehensive podcast script with:
+1. Engaging introduction
+2. Main content segments
+3. Smooth transitions
+4. Compelling conclusion
+5. Call-to-action
+
+Include timestamps and speaking notes."""
+
+PODCAST_EPISODE_PROMPT = """This episode is a {duration_minutes}-minute podcast about {topic}.
+
+User preferences:
+- Complexity: {complexity_level}
+- Tone: {tone}
+- Pace: {pace}
+- Format: {voice_preference}"""
+
+SHOW_NOTES_PROMPT = """Create detailed show notes for the podcast episode about {topic}.
+
+Include:
+- Episode summary
+- Key takeaways
+- Timestamps
+- References and sources
+- Social media snippets
+- Hashtag suggestions"""
+
+FACT_CHECK_PROMPT = """Analyze the content you are given for factual accuracy and identify claims that need verification.
+
+For each claim, provide:
+1. The specific claim
+2. Confidence level (0.0 to 1.0)
+3. Verification status
+4. Recommended sources to check
+5. A brief analysis
+
+Report every claim in a single call to the submit_fact_checks tool."""
+
+class _SearchResultBase(TypedDict):
+    title: str
+    url: str
+    snippet: str
+    relevance_score: float
+    timestamp: str
+
+
+class SearchResult(_SearchResultBase, total=False):
+    """One web_search result."""
+    page_age: Optional[str]
+
+
+class _FetchMetadataBase(TypedDict):
+    url: str
+
+
+class FetchMetadata(_FetchMetadataBase, total=False):
+    """Response details for a web_fetch; failed fetches carry only some of them."""
+    status_code: int
+    content_length: int
+    original_length: int
+    content_type: str
+    last_modified: Optional[str]
+    timestamp: str
+    truncated: bool
+
+
+class _FetchResultBase(TypedDict):
+    content: Optional[str]
+    metadata: FetchMetadata
+    success: bool
+
+
+class FetchResult(_FetchResultBase, total=False):
+    """A web_fetch result; `error` is set when success is False."""
+    error: str
+
+
+# Structured output for fact_check_content: every claim comes back in one tool call
+FACT_CHECK_TOOL = {
+    "name": "submit_fact_checks",
+    "description": "Submit the fact-check results for all claims in the content.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "checks": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "claim": {"type": "string"},
+                        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                        "verification_status": {
+                            "type": "string",
+                            "enum": [status.value for status in VerificationStatus]
+                        },
+                        "sources": {"type": "array", "items": {"type": "string"}},
+                        "analysis": {"type": "string"}
+                    },
+                    "required": ["claim", "confidence", "verification_status", "sources"]
+                }
+            }
+        },
+        "required": ["checks"]
+    }
+}
+
+
+# Regex fallback for html_to_text when selectolax is not installed
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=64)
+def _static_system_block(static_prompt: str) -> Dict[str, Any]:
+    """Build (once per prompt) the cache_control system block for static instructions."""
+    return {
+        "type": "text",
+        "text": static_prompt,
+        "cache_control": {"type": "ephemeral"}
+    }
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to JSON with sorted keys, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, sort_keys=True, default=str, separators=(",", ":"))
+
+
+def html_to_text(html_content: str) -> str:
+    """
+    Extract readable text from an HTML document.
+    
+    Uses selectolax's native parser when installed, otherwise regex stripping.
+    
+    Args:
+        html_content: Raw HTML
+        
+    Returns:
+        Visible text with whitespace collapsed
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html_content)
+        for node in tree.css("script, style, noscript, template"):
+            node.decompose()
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=True) if root else ""
+        return " ".join(text.split())
+    
+    # Remove script and style tags
+    text = _SCRIPT_RE.sub('', html_content)
+    text = _STYLE_RE.sub('', text)
+    
+    # Remove HTML tags
+    text = _TAG_RE.sub(' ', text)
+    
+    # Decode HTML entities
+    text = html.unescape(text)
+    
+    # Clean up whitespace
+    text = _WS_RE.sub(' ', text)
+    return text.strip()
+
+
+def extract_text(body: bytes, encoding: str, media_type: str) -> Tuple[str, int]:
+    """
+    Decode a fetched body and extract its text by media type.
+    
+    Args:
+        body: Raw response body
+        encoding: Character encoding of the body
+        media_type: Response media type, without parameters
+        
+    Returns:
+        Tuple of (extracted text, length of the decoded body)
+    """
+    raw_content = body.decode(encoding, errors="replace")
+    
+    if media_type in FETCH_MARKUP_TYPES:
+        # Extract text content from HTML
+        text = html_to_text(raw_content)
+        
+        # If we got very little text, keep some HTML
+        if len(text) < 200:
+            text = raw_content[:5000]
+    elif media_type in FETCH_JSON_TYPES:
+        # Re-serialize compactly; a body cut off at FETCH_MAX_BYTES won't parse
+        try:
+            text = _dumps(json.loads(raw_content))
+        except ValueError:
+            text = " ".join(raw_content.split())
+    else:
+        text = " ".join(raw_content.split())
+    
+    return text, len(raw_content)
+
 
 class ClaudePodcastService:
     """
@@ -29,31 +384,71 @@ class ClaudePodcastService:
     - Comprehensive logging
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the Claude service.
         
         Args:
             api_key: Anthropic API key. If None, will use ANTHROPIC_API_KEY env var.
+            rate_limiter: Optional shared limiter; a new one is created if omitted
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY environment variable.")
         
-        self.client = Anthropic(api_key=self.api_key)
         self.model = "claude-sonnet-4-20250514"  # Using Claude Sonnet 4 with web search support
         self.max_retries = 3
         self.base_delay = 1.0
+        self._base_params = {"model": self.model}
+        self.rate_limiter = rate_limiter or RateLimiter(rpm=API_RPM, tpm=API_TPM)
         
-        # Initialize HTTP client for web operations
+        # Initialize HTTP client for web fetches; not shared with the Anthropic SDK
         self.http_client = httpx.AsyncClient(
-            timeout=30.0,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            http2=True,
+            follow_redirects=True,
             headers={
-                "User-Agent": "Feedcast-Podcast-Generator/1.0"
+                "User-Agent": "Feedcast-Podcast-Generator/1.0",
+                "Accept-Encoding": FETCH_ACCEPT_ENCODING
             }
         )
         
-        logger.info(f"Claude service initialized with model: {self.model}")
+        # The SDK keeps its own connection pool: given a shared client it would adopt that
+        # client's page-fetch timeouts, which long web_search and fact-check calls exceed.
+        # Retries (and Retry-After handling) live in the backoff decorators, not the SDK
+        self.client = AsyncAnthropic(api_key=self.api_key, timeout=API_TIMEOUT, max_retries=0)
+        
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight_fetches: Dict[str, asyncio.Future] = {}
+        # Per-host fetch slots, kept only while a fetch to the host is running or waiting
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_fetches: Counter = Counter()
+        
+        # Cleared while the API is rate limiting us; every API call waits on it
+        self._requests_open = asyncio.Event()
+        self._requests_open.set()
+        self._reopen_at = 0.0
+        self._reopen_handle: Optional[asyncio.TimerHandle] = None
+        
+        logger.info("Claude service initialized with model: %s", self.model)
+    
+    async def prewarm(self):
+        """
+        Open the connection to the Anthropic API ahead of the first request.
+        
+        Sends a single max_tokens=1 completion so the TLS session is already
+        established when podcast generation starts. Failures are logged, not raised.
+        """
+        try:
+            await self.generate_completion(
+                messages=[{"role": "user", "content": "Hello"}],
+                max_tokens=1,
+                use_cache=False
+            )
+            logger.info("Claude service prewarmed")
+        except Exception as e:
+            logger.warning("Claude service prewarm failed: %s", e)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -63,13 +458,7 @@ class ClaudePodcastService:
         """Async context manager exit."""
         await self.http_client.aclose()
     
-    @backoff.on_exception(
-        backoff.expo,
-        (httpx.HTTPError, httpx.TimeoutException),
-        max_tries=3,
-        base=2
-    )
-    async def web_search(self, query: str) -> List[Dict[str, Any]]:
+    async def web_search(self, query: str) -> List[SearchResult]:
         """
         Perform web search using Claude's web search capabilities.
         
@@ -80,17 +469,23 @@ class ClaudePodcastService:
             List of search results with title, url, snippet, and relevance score
             
         Raises:
-            httpx.HTTPError: If search request fails
+            anthropic.APIError: If search request fails
             ValueError: If query is invalid
         """
         if not query or not query.strip():
             raise ValueError("Search query cannot be empty")
         
-        logger.info(f"Performing web search for: {query}")
+        cache_key = self._cache_key("web_search", {"model": self.model, "query": query})
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info("Web search cache hit for: %s", query)
+            return [dict(result) for result in cached]
+        
+        logger.info("Performing web search for: %s", query)
         
         try:
             # Use Claude's built-in web search tool
-            response = self.client.messages.create(
+            response = await self._create_message(
                 model=self.model,
                 max_tokens=4000,
                 messages=[{
@@ -105,7 +500,8 @@ class ClaudePodcastService:
             )
             
             # Parse search results from Claude's response
-            search_results = []
+            search_results: List[SearchResult] = []
+            now_iso = datetime.now(timezone.utc).isoformat()
             if response.content:
                 for content_block in response.content:
                     # Handle web_search_tool_result blocks
@@ -117,7 +513,7 @@ class ClaudePodcastService:
                                     "url": result.url,
                                     "snippet": result.title,  # Use title as snippet for now
                                     "relevance_score": 0.8,
-                                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                                    "timestamp": now_iso,
                                     "page_age": result.page_age if hasattr(result, 'page_age') else None
                                 })
                     # Also collect text responses
@@ -129,122 +525,222 @@ class ClaudePodcastService:
                                 "url": "https://example.com",
                                 "snippet": content_block.text[:200] + "..." if len(content_block.text) > 200 else content_block.text,
                                 "relevance_score": 0.8,
-                                "timestamp": datetime.now(timezone.utc).isoformat()
+                                "timestamp": now_iso
                             })
             
-            logger.info(f"Web search completed. Found {len(search_results)} results")
+            logger.info("Web search completed. Found %d results", len(search_results), extra={"query": query, "results": len(search_results)})
+            self._set_cached(cache_key, [dict(result) for result in search_results])
             return search_results
             
         except Exception as e:
-            logger.error(f"Web search failed for query '{query}': {str(e)}")
+            logger.error("Web search failed for query '%s': %s", query, e)
             raise
     
-    @backoff.on_exception(
-        backoff.expo,
-        (httpx.HTTPError, httpx.TimeoutException),
-        max_tries=3,
-        base=2
-    )
-    async def web_fetch(self, url: str) -> Dict[str, Any]:
+    async def web_fetch(self, url: str) -> FetchResult:
         """
         Fetch content from a web URL.
         
+        Successful fetches are cached per URL, and concurrent calls for the
+        same URL share a single request.
+        
         Args:
             url: URL to fetch content from
             
         Returns:
-            Dictionary containing fetched content, metadata, and status
+            Dictionary containing fetched content, metadata, and status;
+            success is False if the fetch failed after its retries
             
         Raises:
-            httpx.HTTPError: If fetch request fails
             ValueError: If URL is invalid
         """
         if not url or not url.startswith(('http://', 'https://')):
             raise ValueError("Invalid URL provided")
         
-        logger.info(f"Fetching content from: {url}")
+        cache_key = f"web_fetch:{url}"
+        cached = self._get_cached(cache_key, ttl=FETCH_CACHE_TTL)
+        if cached is not None:
+            logger.info("Web fetch cache hit for: %s", url)
+            return self._copy_fetch_result(cached)
+        
+        inflight = self._inflight_fetches.get(url)
+        if inflight is not None:
+            return self._copy_fetch_result(await asyncio.shield(inflight))
         
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_fetches[url] = future
         try:
-            response = await self.http_client.get(url)
-            response.raise_for_status()
-            
-            html_content = response.text
-            content_length = len(html_content)
-            
-            # Extract text content from HTML
-            import re
-            # Remove script and style tags
-            text = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-            text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-            
-            # Remove HTML tags
-            text = re.sub(r'<[^>]+>', ' ', text)
-            
-            # Decode HTML entities
-            text = text.replace('&nbsp;', ' ').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
-            
-            # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text)
-            text = text.strip()
-            
-            # If we got very little text, keep some HTML
-            if len(text) < 200:
-                text = html_content[:5000]
-            
-            # Extract basic metadata
-            metadata = {
-                "url": url,
-                "status_code": response.status_code,
-                "content_length": len(text),
-                "original_length": content_length,
-                "content_type": response.headers.get("content-type", "unknown"),
-                "last_modified": response.headers.get("last-modified"),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            # Truncate to reasonable size (keep more text now that HTML is stripped)
-            if len(text) > 10000:  # 10KB of text content
-                text = text[:10000] + "... [truncated]"
-                metadata["truncated"] = True
-            
-            result = {
-                "content": text,
-                "metadata": metadata,
-                "success": True
-            }
+            # Failures are reported once _fetch_and_extract has exhausted its retries
+            try:
+                result = await self._fetch_and_extract(url)
+            except httpx.HTTPStatusError as e:
+                logger.error("HTTP error fetching %s: %d", url, e.response.status_code)
+                result = {
+                    "content": None,
+                    "metadata": {"url": url, "status_code": e.response.status_code},
+                    "success": False,
+                    "error": f"HTTP {e.response.status_code}"
+                }
+            except Exception as e:
+                logger.error("Error fetching %s: %s", url, e)
+                result = {
+                    "content": None,
+                    "metadata": {"url": url},
+                    "success": False,
+                    "error": str(e)
+                }
             
-            logger.info(f"Successfully fetched content from {url} ({len(text)} chars)")
+            if result["success"]:
+                self._set_cached(cache_key, self._copy_fetch_result(result))
+            future.set_result(result)
             return result
-            
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching {url}: {e.response.status_code}")
-            return {
-                "content": None,
-                "metadata": {"url": url, "status_code": e.response.status_code},
-                "success": False,
-                "error": f"HTTP {e.response.status_code}"
-            }
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {str(e)}")
-            return {
-                "content": None,
-                "metadata": {"url": url},
-                "success": False,
-                "error": str(e)
-            }
+        finally:
+            del self._inflight_fetches[url]
+            if not future.done():
+                future.cancel()
     
     @backoff.on_exception(
-        backoff.expo,
-        Exception,
+        retry_after_expo,
+        RETRYABLE_HTTP_ERRORS,
         max_tries=3,
-        base=2
+        jitter=None,
+        giveup=is_permanent_error
     )
+    async def _fetch_and_extract(self, url: str) -> FetchResult:
+        """
+        Fetch a URL and extract its text, without caching.
+        
+        Transport errors and 408/409/429/5xx responses are retried, waiting at
+        least as long as the site's Retry-After asks.
+        
+        Args:
+            url: URL to fetch content from
+            
+        Returns:
+            Dictionary containing fetched content, metadata, and status
+            
+        Raises:
+            httpx.HTTPStatusError: If the site answers with an error status
+            httpx.TransportError: If the request fails on every attempt
+        """
+        logger.info("Fetching content from: %s", url)
+        
+        # Stream the body and stop at FETCH_MAX_BYTES instead of buffering whole pages
+        async with self.http_client.stream("GET", url, timeout=HTTP_TIMEOUT) as response:
+            response.raise_for_status()
+            logger.debug("Fetched %s with content-encoding %s", url, response.headers.get("content-encoding"))
+            
+            content_type = response.headers.get("content-type", "")
+            media_type = content_type.split(";", 1)[0].strip().lower()
+            if media_type not in FETCH_MARKUP_TYPES | FETCH_JSON_TYPES | FETCH_PLAIN_TYPES:
+                logger.info("Skipping %s: unsupported content type %s", url, content_type)
+                return {
+                    "content": None,
+                    "metadata": {"url": url, "status_code": response.status_code, "content_type": content_type},
+                    "success": False,
+                    "error": f"Unsupported content type: {content_type}"
+                }
+            
+            body = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=FETCH_CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) >= FETCH_MAX_BYTES:
+                    break
+        
+        raw_body = bytes(body[:FETCH_MAX_BYTES])
+        encoding = response.encoding or "utf-8"
+        if len(raw_body) > FETCH_OFFLOAD_BYTES:
+            # Parsing a large page takes milliseconds that would stall every other fetch
+            text, content_length = await asyncio.to_thread(extract_text, raw_body, encoding, media_type)
+        else:
+            text, content_length = extract_text(raw_body, encoding, media_type)
+        
+        # Extract basic metadata
+        metadata: FetchMetadata = {
+            "url": url,
+            "status_code": response.status_code,
+            "content_length": len(text),
+            "original_length": content_length,
+            "content_type": response.headers.get("content-type", "unknown"),
+            "last_modified": response.headers.get("last-modified"),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        
+        # Truncate to reasonable size (keep more text now that HTML is stripped)
+        if len(text) > 10000:  # 10KB of text content
+            text = text[:10000] + "... [truncated]"
+            metadata["truncated"] = True
+        
+        result = {
+            "content": text,
+            "metadata": metadata,
+            "success": True
+        }
+        
+        logger.info("Successfully fetched content from %s (%d chars)", url, len(text), extra={"url": url, "chars": len(text)})
+        return result
+    
+    async def web_fetch_many(
+        self,
+        urls: List[str],
+        concurrency: int = FETCH_CONCURRENCY,
+        timeout: Optional[float] = None
+    ) -> List[Union[FetchResult, BaseException]]:
+        """
+        Fetch several URLs concurrently with bounded fan-out.
+        
+        At most `concurrency` fetches run at once, and at most
+        FETCH_PER_HOST_CONCURRENCY of those hit the same host.
+        
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum fetches in flight for this batch
+            timeout: Seconds each fetch may take, retries included, once it
+                starts; time spent queued for a slot doesn't count
+            
+        Returns:
+            web_fetch results in the order of `urls`; a failed fetch yields its
+            exception (asyncio.TimeoutError when it ran past `timeout`)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(url: str) -> FetchResult:
+            async with semaphore, self._host_slot(urlparse(url).netloc):
+                return await asyncio.wait_for(self.web_fetch(url), timeout=timeout)
+        
+        return await asyncio.gather(*(fetch_one(url) for url in urls), return_exceptions=True)
+    
+    @contextlib.asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        """
+        Hold one of a host's FETCH_PER_HOST_CONCURRENCY fetch slots.
+        
+        The host's semaphore is created on first use and dropped once no
+        fetch to it is running or waiting, so the long-lived service doesn't
+        keep one for every host it has ever fetched.
+        
+        Args:
+            host: URL netloc to limit
+        """
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(FETCH_PER_HOST_CONCURRENCY)
+        self._host_fetches[host] += 1
+        try:
+            async with semaphore:
+                yield
+        finally:
+            self._host_fetches[host] -= 1
+            if not self._host_fetches[host]:
+                del self._host_fetches[host]
+                del self._host_semaphores[host]
+    
     async def generate_completion(
         self, 
         messages: List[Dict[str, str]], 
         max_tokens: int = 4000,
         temperature: float = 0.7,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        use_cache: bool = True
     ) -> str:
         """
         Generate text completion using Claude.
@@ -253,7 +749,9 @@ class ClaudePodcastService:
             messages: List of message dictionaries with 'role' and 'content'
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 to 1.0)
-            system_prompt: Optional system prompt
+            system_prompt: Optional system prompt, either a string (sent as one
+                cached block) or a list of content blocks from _system_blocks
+            use_cache: Serve and store identical requests from the response cache
             
         Returns:
             Generated text completion
@@ -264,42 +762,209 @@ class ClaudePodcastService:
         if not messages:
             raise ValueError("Messages list cannot be empty")
         
-        logger.info(f"Generating completion with {len(messages)} messages, max_tokens={max_tokens}")
+        logger.info("Generating completion with %d messages, max_tokens=%d", len(messages), max_tokens)
         
         try:
-            # Prepare the request
-            request_params = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": messages
-            }
+            request_params = self._completion_params(messages, max_tokens, temperature, system_prompt)
             
-            if system_prompt:
-                request_params["system"] = system_prompt
+            cache_key = self._cache_key("completion", request_params)
+            cached = self._get_cached(cache_key) if use_cache else None
+            if cached is not None:
+                logger.info("Completion cache hit (%d chars)", len(cached))
+                return cached
             
-            # Make the API call
-            response = self.client.messages.create(**request_params)
+            chunks = [text async for text in self._stream_text(request_params)]
+            completion_text = "".join(chunks)
             
-            # Extract the completion text
-            completion_text = ""
-            if response.content:
-                for content_block in response.content:
-                    if hasattr(content_block, 'text'):
-                        completion_text += content_block.text
-            
-            logger.info(f"Completion generated successfully ({len(completion_text)} chars)")
+            logger.info("Completion generated successfully (%d chars)", len(completion_text), extra={"chars": len(completion_text)})
+            if use_cache:
+                self._set_cached(cache_key, completion_text)
             return completion_text
             
         except Exception as e:
-            logger.error(f"Completion generation failed: {str(e)}")
+            logger.error("Completion generation failed: %s", e)
             raise
     
+    async def generate_completion_stream(
+        self, 
+        messages: List[Dict[str, str]], 
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        system_prompt: Optional[Union[str, List[Dict[str, Any]]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a text completion from Claude as it is generated.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 to 1.0)
+            system_prompt: Optional system prompt, as for generate_completion
+            
+        Yields:
+            Text chunks as Claude produces them
+            
+        Raises:
+            anthropic.APIError: If the request fails
+        """
+        if not messages:
+            raise ValueError("Messages list cannot be empty")
+        
+        request_params = self._completion_params(messages, max_tokens, temperature, system_prompt)
+        async for text in self._stream_text(request_params):
+            yield text
+    
+    def _completion_params(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[Union[str, List[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """Build the messages.create arguments for a completion request."""
+        request_params = {
+            **self._base_params,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": messages
+        }
+        
+        if system_prompt:
+            if isinstance(system_prompt, str):
+                system_prompt = self._system_blocks(system_prompt)
+            request_params["system"] = system_prompt
+        
+        return request_params
+    
+    async def _stream_text(self, request_params: Dict[str, Any]) -> AsyncIterator[str]:
+        """Yield the text deltas of a streamed messages.create request."""
+        stream = await self._create_message(**request_params, stream=True)
+        async for event in stream:
+            if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                yield event.delta.text
+    
+    @backoff.on_exception(
+        retry_after_expo,
+        RETRYABLE_API_ERRORS,
+        max_tries=3,
+        jitter=None,
+        giveup=is_permanent_error,
+        on_backoff=pause_on_rate_limit
+    )
+    async def _create_message(self, **params) -> Any:
+        """
+        Send a messages.create request once the rate limit gate is open
+        and the request fits the client-side budget.
+        
+        With stream=True the request is sent (and retried) before the first
+        event is returned.
+        
+        Args:
+            **params: Keyword arguments for messages.create
+            
+        Returns:
+            The Anthropic message response, or an event stream when stream=True
+        """
+        await self._requests_open.wait()
+        await self.rate_limiter.acquire(self._estimate_tokens(params))
+        return await self.client.messages.create(**params)
+    
+    @staticmethod
+    def _estimate_tokens(params: Dict[str, Any]) -> int:
+        """
+        Estimate the tokens a request will use (input plus max output).
+        
+        Args:
+            params: Keyword arguments for messages.create
+            
+        Returns:
+            Estimated token count
+        """
+        chars = sum(len(block.get("text", "")) for block in params.get("system") or [])
+        for msg in params.get("messages", []):
+            content = msg.get("content", "")
+            chars += len(content) if isinstance(content, str) else len(str(content))
+        
+        return chars // CHARS_PER_TOKEN + params.get("max_tokens", 0)
+    
+    def _pause_requests(self, delay: float):
+        """
+        Hold new API calls for `delay` seconds after a rate limit response.
+        
+        Overlapping pauses extend the window rather than shortening it.
+        """
+        reopen_at = time.monotonic() + delay
+        if reopen_at <= self._reopen_at:
+            return
+        
+        logger.warning("Rate limited by the Anthropic API; pausing requests for %.1fs", delay)
+        self._reopen_at = reopen_at
+        self._requests_open.clear()
+        if self._reopen_handle:
+            self._reopen_handle.cancel()
+        self._reopen_handle = asyncio.get_running_loop().call_later(delay, self._requests_open.set)
+    
+    @staticmethod
+    def _cache_key(kind: str, params: Dict[str, Any]) -> str:
+        """Hash a request's parameters into a response cache key."""
+        payload = _dumps(params)
+        return f"{kind}:{hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()}"
+    
+    def _get_cached(self, key: str, ttl: float = RESPONSE_CACHE_TTL) -> Optional[Any]:
+        """Return the cached response for a key if it is younger than `ttl` seconds."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.monotonic() - stored_at > ttl:
+            del self._cache[key]
+            return None
+        
+        self._cache.move_to_end(key)
+        return value
+    
+    def _set_cached(self, key: str, value: Any):
+        """Cache a response, evicting the least recently used entry when full."""
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > RESPONSE_CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+    
+    @staticmethod
+    def _copy_fetch_result(result: FetchResult) -> FetchResult:
+        """Copy a web_fetch result so callers can't mutate a cached or shared one."""
+        return {**result, "metadata": dict(result["metadata"])}
+    
+    @staticmethod
+    def _system_blocks(static_prompt: str, dynamic_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Build system prompt content blocks for Claude.
+        
+        The static instructions are marked with cache_control so repeat calls
+        reuse Anthropic's prompt cache; the per-request part follows uncached.
+        
+        Args:
+            static_prompt: Instructions shared across requests
+            dynamic_prompt: Optional request-specific context
+            
+        Returns:
+            List of system prompt content blocks; the static block is shared
+            between calls and must not be mutated
+        """
+        blocks = [_static_system_block(static_prompt)]
+        
+        if dynamic_prompt:
+            blocks.append({"type": "text", "text": dynamic_prompt})
+        
+        return blocks
+    
     async def generate_podcast_content(
         self,
         topic: str,
         user_preferences: Dict[str, Any],
-        duration_minutes: int = 30
+        duration_minutes: int = 30,
+        on_script_chunk: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         Generate complete podcast content for a given topic.
@@ -308,33 +973,30 @@ class ClaudePodcastService:
             topic: Podcast topic
             user_preferences: User preference settings
             duration_minutes: Target duration in minutes
+            on_script_chunk: Optional callback awaited with each script chunk as it
+                streams in, so downstream steps (e.g. TTS) can start before it finishes
             
         Returns:
             Dictionary containing generated podcast content
         """
-        logger.info(f"Generating podcast content for topic: {topic}")
+        logger.info("Generating podcast content for topic: %s", topic)
         
         try:
             # 1. Search for current information about the topic
-            search_results = await self.web_search(f"{topic} latest news developments")
+            search_query = f"{topic} latest news developments"
             
             # 2. Generate podcast script
-            system_prompt = f"""You are a professional podcast producer creating content for a {duration_minutes}-minute podcast episode about {topic}.
-
-User preferences:
-- Complexity: {user_preferences.get('complexity_level', 'intermediate')}
-- Tone: {user_preferences.get('tone', 'conversational')}
-- Pace: {user_preferences.get('pace', 'moderate')}
-- Format: {user_preferences.get('voice_preference', 'single')}
-
-Create a comprehensive podcast script with:
-1. Engaging introduction
-2. Main content segments
-3. Smooth transitions
-4. Compelling conclusion
-5. Call-to-action
-
-Include timestamps and speaking notes."""
+            system_prompt = self._system_blocks(
+                PODCAST_PRODUCER_PROMPT,
+                PODCAST_EPISODE_PROMPT.format(
+                    duration_minutes=duration_minutes,
+                    topic=topic,
+                    complexity_level=user_preferences.get('complexity_level', 'intermediate'),
+                    tone=user_preferences.get('tone', 'conversational'),
+                    pace=user_preferences.get('pace', 'moderate'),
+                    voice_preference=user_preferences.get('voice_preference', 'single')
+                )
+            )
 
             messages = [
                 {
@@ -343,26 +1005,35 @@ Include timestamps and speaking notes."""
                 }
             ]
             
-            script = await self.generate_completion(
-                messages=messages,
-                max_tokens=4000,
-                system_prompt=system_prompt
-            )
+            async def research_and_write_script():
+                results = await self.web_search(search_query)
+                if on_script_chunk is None:
+                    script = await self.generate_completion(
+                        messages=messages,
+                        max_tokens=4000,
+                        system_prompt=system_prompt
+                    )
+                    return results, script
+                
+                chunks = []
+                async for text in self.generate_completion_stream(
+                    messages=messages,
+                    max_tokens=4000,
+                    system_prompt=system_prompt
+                ):
+                    chunks.append(text)
+                    await on_script_chunk(text)
+                return results, "".join(chunks)
             
-            # 3. Generate show notes
-            show_notes_prompt = f"""Create detailed show notes for the podcast episode about {topic}.
+            # 3. Generate show notes - they only need the topic, so they run alongside steps 1-2
+            show_notes_prompt = SHOW_NOTES_PROMPT.format(topic=topic)
 
-Include:
-- Episode summary
-- Key takeaways
-- Timestamps
-- References and sources
-- Social media snippets
-- Hashtag suggestions"""
-
-            show_notes = await self.generate_completion(
-                messages=[{"role": "user", "content": show_notes_prompt}],
-                max_tokens=2000
+            (search_results, script), show_notes = await asyncio.gather(
+                research_and_write_script(),
+                self.generate_completion(
+                    messages=[{"role": "user", "content": show_notes_prompt}],
+                    max_tokens=2000
+                )
             )
             
             result = {
@@ -371,15 +1042,15 @@ Include:
                 "script": script,
                 "show_notes": show_notes,
                 "search_results": search_results,
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": datetime.now(timezone.utc).isoformat(),
                 "user_preferences": user_preferences
             }
             
-            logger.info(f"Podcast content generated successfully for topic: {topic}")
+            logger.info("Podcast content generated successfully for topic: %s", topic)
             return result
             
         except Exception as e:
-            logger.error(f"Failed to generate podcast content for {topic}: {str(e)}")
+            logger.error("Failed to generate podcast content for %s: %s", topic, e)
             raise
     
     async def fact_check_content(self, content: str) -> List[Dict[str, Any]]:
@@ -395,37 +1066,33 @@ Include:
         logger.info("Performing fact-check on content")
         
         try:
-            fact_check_prompt = f"""Analyze the following content for factual accuracy and identify claims that need verification:
-
-{content}
-
-For each claim, provide:
-1. The specific claim
-2. Confidence level (0.0 to 1.0)
-3. Verification status
-4. Recommended sources to check"""
-
-            messages = [{"role": "user", "content": fact_check_prompt}]
+            messages = [{"role": "user", "content": content}]
             
-            fact_check_analysis = await self.generate_completion(
-                messages=messages,
-                max_tokens=2000
-            )
+            request_params = self._completion_params(messages, 2000, 0.7, FACT_CHECK_PROMPT)
+            request_params["tools"] = [FACT_CHECK_TOOL]
+            request_params["tool_choice"] = {"type": "tool", "name": FACT_CHECK_TOOL["name"]}
+            
+            cache_key = self._cache_key("fact_check", request_params)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                logger.info("Fact-check cache hit (%d claims)", len(cached))
+                return [dict(check) for check in cached]
             
-            # Parse the fact-check results (simplified - in production you'd want more robust parsing)
-            fact_checks = [{
-                "claim": "Sample claim from content",
-                "confidence": 0.8,
-                "verification_status": "verified",
-                "sources": ["https://example.com"],
-                "analysis": fact_check_analysis
-            }]
+            response = await self._create_message(**request_params)
             
-            logger.info(f"Fact-check completed. Found {len(fact_checks)} claims to verify")
+            # The forced tool call carries every claim as structured input
+            fact_checks = []
+            for content_block in response.content:
+                if content_block.type == "tool_use" and content_block.name == FACT_CHECK_TOOL["name"]:
+                    fact_checks = list(content_block.input.get("checks", []))
+                    break
+            
+            self._set_cached(cache_key, [dict(check) for check in fact_checks])
+            logger.info("Fact-check completed. Found %d claims to verify", len(fact_checks))
             return fact_checks
             
         except Exception as e:
-            logger.error(f"Fact-check failed: {str(e)}")
+            logger.error("Fact-check failed: %s", e)
             raise
     
     async def close(self):
@@ -434,10 +1101,41 @@ For each claim, provide:
         logger.info("Claude service closed")
 
 
+# Process-wide instance, so every request shares one connection pool and cache
+_service: Optional[ClaudePodcastService] = None
+
+
+async def get_claude_service() -> ClaudePodcastService:
+    """
+    Return the shared Claude service, creating it on first use.
+    
+    Takes no arguments so it can be used directly as a FastAPI dependency;
+    the API key comes from ANTHROPIC_API_KEY.
+    
+    Returns:
+        The process-wide ClaudePodcastService instance
+    """
+    global _service
+    if _service is None:
+        _service = ClaudePodcastService()
+    return _service
+
+
+async def shutdown_claude_service():
+    """Close the shared Claude service, if one was created."""
+    global _service
+    if _service is not None:
+        service, _service = _service, None
+        await service.close()
+
+
 # Convenience function for easy usage
 async def create_claude_service(api_key: Optional[str] = None) -> ClaudePodcastService:
     """
-    Create and return a Claude service instance.
+    Create and return a new Claude service instance.
+    
+    Each instance opens its own connection pool; use get_claude_service
+    instead when serving requests.
     
     Args:
         api_key: Optional API key override
@@ -3,18 +3,173 @@ Fact-checking module for podcast content validation.
 Provides multi-source validation and claim verification using Claude AI.
 """
 
+import re
+import time
+import heapq
+import functools
+import hashlib
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, TypedDict
+from operator import attrgetter
 from datetime import datetime
 import json
 
+import anthropic
+
 from .types import Source, FactCheck, VerificationStatus
-from .claude_service import ClaudePodcastService
+from .claude_service import ClaudePodcastService, get_claude_service
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; falls back to the stdlib json module
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency; summaries fall back to a Python loop
+    np = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Validation calls to Claude in flight at once, across all validate_all_claims calls
+CLAIM_VALIDATION_CONCURRENCY = 10
+
+# Claims validated together in one Claude call, sharing a single copy of the sources
+CLAIM_BATCH_SIZE = 10
+
+# Errors every other validation would hit too: they cancel the run instead of
+# degrading each claim to a fallback FactCheck
+FATAL_API_ERRORS = (anthropic.AuthenticationError, anthropic.PermissionDeniedError)
+
+# Numbered ("1.", "10)") or bulleted ("-", "•", "*") lines in a free-text claim list
+_CLAIM_LINE_RE = re.compile(r'^[ \t]*(?:\d+[.)][ \t]*|[-•*][ \t]+)(\S.*?)[ \t\r]*$', re.MULTILINE)
+
+
+# Collapses whitespace and punctuation so trivially different claims compare equal
+_CLAIM_NOISE_RE = re.compile(r'[\W_]+')
+
+
+def _claim_key(claim: str) -> str:
+    """Normalize a claim for duplicate detection (case, whitespace, punctuation)."""
+    return _CLAIM_NOISE_RE.sub(' ', claim.casefold()).strip()
+
+
+def _loads(data: str) -> Any:
+    """Parse JSON, using orjson when installed; errors are json.JSONDecodeError either way."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+SINGLE_VERDICT_FORMAT = """Respond with only this JSON object:
+{
+    "confidence": "high|medium|low",
+    "verification_status": "verified|partially_verified|unverified|disputed",
+    "supporting_sources": [list of source indices that support the claim],
+    "contradicting_sources": [list of source indices that contradict the claim],
+    "notes": "One sentence of context or limitations"
+}"""
+
+BATCH_VERDICT_FORMAT = """Respond with only a JSON array containing exactly one object per claim:
+[
+    {
+        "claim_index": 0,
+        "confidence": "high|medium|low",
+        "verification_status": "verified|partially_verified|unverified|disputed",
+        "supporting_sources": [list of source indices that support the claim],
+        "contradicting_sources": [list of source indices that contradict the claim],
+        "notes": "One sentence of context or limitations"
+    }
+]"""
+
+
+@functools.lru_cache(maxsize=32)
+def _validation_system_prompt(sources_json: str) -> str:
+    """
+    Build the validation instructions for a source set.
+    
+    Built once per source set, so every claim validated against the same
+    sources sends an identical, prompt-cacheable system prompt.
+    
+    Args:
+        sources_json: Serialized sources, from FactChecker._serialize_sources
+        
+    Returns:
+        System prompt with the sources and grading guide
+    """
+    # Concatenated rather than formatted: sources can contain braces
+    return (
+        "You validate factual claims against the sources below to determine "
+        "their accuracy and verification status.\n\n"
+        "SOURCES TO CHECK:\n" + sources_json + "\n\n"
+        "For each claim and each source, determine whether the source SUPPORTS the claim, "
+        "CONTRADICTS it, or provides NEUTRAL/INSUFFICIENT information, taking the source's "
+        "credibility into account.\n\n" + VALIDATION_GUIDE
+    )
+
+
+# Output budgets: verdicts carry only the fields FactCheck uses, so they stay short
+VALIDATION_MAX_TOKENS = 800
+VALIDATION_TOKENS_PER_CLAIM = 250
+BATCH_VALIDATION_MAX_TOKENS = 4000
+FUSED_VALIDATION_MAX_TOKENS = 8000
+
+class Verdict(TypedDict, total=False):
+    """Claude's validation of one claim, as parsed from its JSON response.
+    
+    Every field is optional because the model may omit any of them;
+    _build_fact_check applies the defaults.
+    """
+    claim_index: int
+    claim: str
+    confidence: str
+    verification_status: str
+    supporting_sources: List[int]
+    contradicting_sources: List[int]
+    notes: str
+
+
+# Source fields sent to Claude; published_date is added for validation prompts
+PROMPT_SOURCE_FIELDS = frozenset({"title", "publication", "url", "content_summary", "credibility_score"})
+
+# Claude's verdicts by (claim, sources), so repeat validations skip the API
+VERDICT_CACHE_MAXSIZE = 2048
+VERDICT_CACHE_TTL = 3600  # Seconds
+
+# get_validation_summary switches to NumPy from this many fact checks
+VECTORIZED_SUMMARY_MIN_CLAIMS = 64
+STATUS_CODES = {status: code for code, status in enumerate(VerificationStatus)}
+
+# Shared by validate_claim and validate_claims_batch
+CONFIDENCE_MAP = {"high": 0.9, "medium": 0.6, "low": 0.3}
+STATUS_MAP = {
+    "verified": VerificationStatus.VERIFIED,
+    "partially_verified": VerificationStatus.PARTIALLY_VERIFIED,
+    "unverified": VerificationStatus.UNVERIFIED,
+    "disputed": VerificationStatus.DISPUTED
+}
+
+VALIDATION_GUIDE = """Confidence levels:
+- HIGH: Multiple credible sources agree, claim is well-supported
+- MEDIUM: Some sources support, some are neutral, or limited sources
+- LOW: Contradictory sources, low credibility sources, or insufficient evidence
+
+Verification status:
+- VERIFIED: Claim is supported by credible sources
+- PARTIALLY_VERIFIED: Claim is partially supported or has some limitations
+- UNVERIFIED: Insufficient evidence to determine accuracy
+- DISPUTED: Sources contradict each other or claim is disputed"""
+
 
 class FactChecker:
     """
@@ -32,6 +187,8 @@ class FactChecker:
             claude_service: Claude service instance for AI analysis
         """
         self.claude = claude_service
+        self._semaphore = asyncio.Semaphore(CLAIM_VALIDATION_CONCURRENCY)
+        self._verdict_cache: "OrderedDict[Tuple[str, str], Tuple[float, Verdict]]" = OrderedDict()
         logger.info("FactChecker initialized")
     
     async def extract_claims(self, sources: List[Source]) -> List[str]:
@@ -55,23 +212,13 @@ class FactChecker:
         
         try:
             # Prepare source content for analysis
-            source_content = []
-            for i, source in enumerate(sources):
-                source_info = {
-                    "index": i,
-                    "title": source.title,
-                    "publication": source.publication,
-                    "url": source.url,
-                    "summary": source.content_summary,
-                    "credibility_score": source.credibility_score
-                }
-                source_content.append(source_info)
+            sources_json = self._serialize_sources(sources, include_date=False)
             
             # Create prompt for claim extraction
             extraction_prompt = f"""Analyze the following sources and extract all factual claims that can be verified or disputed.
 
 Sources:
-{json.dumps(source_content, indent=2)}
+{sources_json}
 
 For each source, identify:
 1. Specific factual statements
@@ -100,7 +247,7 @@ Focus on claims that are:
             
             # Parse the JSON response
             try:
-                claims = json.loads(response)
+                claims = _loads(response)
                 if not isinstance(claims, list):
                     raise ValueError("Response is not a list")
                 
@@ -125,7 +272,8 @@ Focus on claims that are:
     async def validate_claim(
         self, 
         claim: str, 
-        sources: List[Source]
+        sources: List[Source],
+        sources_json: Optional[str] = None
     ) -> FactCheck:
         """
         Validate a claim across multiple sources using Claude.
@@ -133,6 +281,7 @@ Focus on claims that are:
         Args:
             claim: The factual claim to validate
             sources: List of sources to check against
+            sources_json: Optional precomputed _serialize_sources(sources)
             
         Returns:
             FactCheck object with validation results
@@ -151,103 +300,36 @@ Focus on claims that are:
         
         try:
             # Prepare source information for analysis
-            source_analysis = []
-            for i, source in enumerate(sources):
-                source_info = {
-                    "index": i,
-                    "title": source.title,
-                    "publication": source.publication,
-                    "url": source.url,
-                    "summary": source.content_summary,
-                    "credibility_score": source.credibility_score,
-                    "published_date": source.published_date.isoformat() if source.published_date else None
-                }
-                source_analysis.append(source_info)
-            
-            # Create comprehensive validation prompt
-            validation_prompt = f"""Analyze the following claim against multiple sources to determine its accuracy and verification status.
-
-CLAIM TO VALIDATE: "{claim}"
-
-SOURCES TO CHECK:
-{json.dumps(source_analysis, indent=2)}
-
-For each source, determine:
-1. Does this source SUPPORT the claim?
-2. Does this source CONTRADICT the claim?
-3. Does this source provide NEUTRAL/INSUFFICIENT information?
-4. What is the source's credibility level?
-
-Based on your analysis, provide a JSON response with:
-{{
-    "claim": "{claim}",
-    "confidence": "high|medium|low",
-    "verification_status": "verified|partially_verified|unverified|disputed",
-    "supporting_sources": [list of source indices that support the claim],
-    "contradicting_sources": [list of source indices that contradict the claim],
-    "neutral_sources": [list of source indices with neutral/insufficient info],
-    "analysis": "Detailed explanation of the validation reasoning",
-    "notes": "Additional context or limitations"
-}}
-
-Confidence levels:
-- HIGH: Multiple credible sources agree, claim is well-supported
-- MEDIUM: Some sources support, some are neutral, or limited sources
-- LOW: Contradictory sources, low credibility sources, or insufficient evidence
-
-Verification status:
-- VERIFIED: Claim is supported by credible sources
-- PARTIALLY_VERIFIED: Claim is partially supported or has some limitations
-- UNVERIFIED: Insufficient evidence to determine accuracy
-- DISPUTED: Sources contradict each other or claim is disputed"""
-
-            messages = [{"role": "user", "content": validation_prompt}]
+            if sources_json is None:
+                sources_json = self._serialize_sources(sources)
+            sources_key = self._sources_key(sources_json)
+            
+            cached = self._get_cached_verdict(claim, sources_key)
+            if cached is not None:
+                logger.info("Claim validation served from cache")
+                return self._build_fact_check(claim, cached, sources)
+            
+            # The sources prefix is built once per source set and cached by Anthropic;
+            # only the claim varies between calls
+            messages = [{
+                "role": "user",
+                "content": f"CLAIM TO VALIDATE: {_dumps(claim)}\n\n{SINGLE_VERDICT_FORMAT}"
+            }]
             
             response = await self.claude.generate_completion(
                 messages=messages,
-                max_tokens=4000,
-                temperature=0.2  # Very low temperature for consistent validation
+                max_tokens=VALIDATION_MAX_TOKENS,
+                temperature=0.2,  # Very low temperature for consistent validation
+                system_prompt=_validation_system_prompt(sources_json)
             )
             
             # Parse the validation response
             try:
-                validation_data = json.loads(response)
+                validation_data = _loads(response)
+                fact_check = self._build_fact_check(claim, validation_data, sources)
+                self._set_cached_verdict(claim, sources_key, validation_data)
                 
-                # Map confidence string to numeric value
-                confidence_map = {"high": 0.9, "medium": 0.6, "low": 0.3}
-                confidence = confidence_map.get(validation_data.get("confidence", "low"), 0.3)
-                
-                # Map verification status
-                status_map = {
-                    "verified": VerificationStatus.VERIFIED,
-                    "partially_verified": VerificationStatus.PARTIALLY_VERIFIED,
-                    "unverified": VerificationStatus.UNVERIFIED,
-                    "disputed": VerificationStatus.DISPUTED
-                }
-                verification_status = status_map.get(
-                    validation_data.get("verification_status", "unverified"),
-                    VerificationStatus.UNVERIFIED
-                )
-                
-                # Get relevant sources based on validation results
-                supporting_indices = validation_data.get("supporting_sources", [])
-                contradicting_indices = validation_data.get("contradicting_sources", [])
-                
-                relevant_sources = []
-                for idx in supporting_indices + contradicting_indices:
-                    if 0 <= idx < len(sources):
-                        relevant_sources.append(sources[idx])
-                
-                # Create FactCheck object
-                fact_check = FactCheck(
-                    claim=claim,
-                    confidence=confidence,
-                    verification_status=verification_status,
-                    sources=relevant_sources,
-                    notes=validation_data.get("notes", "")
-                )
-                
-                logger.info(f"Claim validation completed: {verification_status.value} (confidence: {confidence})")
+                logger.info(f"Claim validation completed: {fact_check.verification_status.value} (confidence: {fact_check.confidence})")
                 return fact_check
                 
             except json.JSONDecodeError as e:
@@ -259,15 +341,224 @@ Verification status:
             logger.error(f"Failed to validate claim '{claim}': {str(e)}")
             raise
     
-    async def validate_all_claims(self, sources: List[Source]) -> List[FactCheck]:
+    async def validate_claims_batch(
+        self, 
+        claims: List[str], 
+        sources: List[Source],
+        sources_json: Optional[str] = None
+    ) -> List[FactCheck]:
+        """
+        Validate several claims against the same sources in one Claude call.
+        
+        Args:
+            claims: The factual claims to validate
+            sources: List of sources to check against
+            sources_json: Optional precomputed _serialize_sources(sources)
+            
+        Returns:
+            FactCheck objects in the same order as claims
+            
+        Raises:
+            ValueError: If claims or sources list is empty
+            Exception: If validation fails
+        """
+        if not claims:
+            raise ValueError("Claims list cannot be empty")
+        
+        if not sources:
+            raise ValueError("Sources list cannot be empty")
+        
+        logger.info(f"Validating batch of {len(claims)} claims")
+        
+        if sources_json is None:
+            sources_json = self._serialize_sources(sources)
+        sources_key = self._sources_key(sources_json)
+        
+        # Serve repeat validations from the verdict cache; only new claims go to Claude
+        verdicts_by_claim = {}
+        pending = []
+        for claim in claims:
+            cached = self._get_cached_verdict(claim, sources_key)
+            if cached is not None:
+                verdicts_by_claim[claim] = cached
+            elif claim not in pending:
+                pending.append(claim)
+        
+        if pending:
+            verdicts_by_claim.update(await self._request_verdicts(pending, sources_json, sources_key))
+        
+        fact_checks = []
+        for claim in claims:
+            validation_data = verdicts_by_claim.get(claim)
+            if validation_data is None:
+                fact_checks.append(self._create_fallback_fact_check(claim, sources))
+            else:
+                fact_checks.append(self._build_fact_check(claim, validation_data, sources))
+        
+        logger.info(f"Batch validation completed for {len(claims)} claims")
+        return fact_checks
+    
+    async def _request_verdicts(
+        self, 
+        claims: List[str], 
+        sources_json: str, 
+        sources_key: str
+    ) -> Dict[str, Verdict]:
+        """
+        Ask Claude for verdicts on several claims and cache the ones it returns.
+        
+        Args:
+            claims: Claims with no cached verdict
+            sources_json: Serialized sources, from _serialize_sources
+            sources_key: Verdict cache key for the sources, from _sources_key
+            
+        Returns:
+            Verdict dictionaries by claim; claims Claude skipped are left out
+        """
+        claim_list = [{"claim_index": i, "claim": claim} for i, claim in enumerate(claims)]
+        
+        messages = [{
+            "role": "user",
+            "content": f"CLAIMS TO VALIDATE:\n{_dumps(claim_list)}\n\n{BATCH_VERDICT_FORMAT}"
+        }]
+        
+        response = await self.claude.generate_completion(
+            messages=messages,
+            max_tokens=min(BATCH_VALIDATION_MAX_TOKENS, VALIDATION_TOKENS_PER_CLAIM * len(claims)),
+            temperature=0.2,  # Very low temperature for consistent validation
+            system_prompt=_validation_system_prompt(sources_json)
+        )
+        
+        try:
+            verdicts = _loads(response)
+            if not isinstance(verdicts, list):
+                raise ValueError("Response is not a list")
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Failed to parse batch validation JSON: {e}")
+            return {}
+        
+        verdicts_by_claim = {}
+        for verdict in verdicts:
+            if not isinstance(verdict, dict):
+                continue
+            index = verdict.get("claim_index")
+            if isinstance(index, int) and 0 <= index < len(claims):
+                verdicts_by_claim[claims[index]] = verdict
+                self._set_cached_verdict(claims[index], sources_key, verdict)
+        
+        return verdicts_by_claim
+    
+    async def extract_and_validate(
+        self, 
+        sources: List[Source], 
+        sources_json: Optional[str] = None
+    ) -> List[FactCheck]:
+        """
+        Extract claims from sources and validate them in a single Claude call.
+        
+        Args:
+            sources: List of sources to analyze
+            sources_json: Optional precomputed _serialize_sources(sources)
+            
+        Returns:
+            List of FactCheck objects, one per extracted claim
+            
+        Raises:
+            ValueError: If sources list is empty or the response can't be parsed
+            Exception: If the Claude call fails
+        """
+        if not sources:
+            raise ValueError("Sources list cannot be empty")
+        
+        logger.info(f"Extracting and validating claims from {len(sources)} sources")
+        
+        if sources_json is None:
+            sources_json = self._serialize_sources(sources)
+        sources_key = self._sources_key(sources_json)
+        
+        prompt = f"""Analyze the following sources, extract the factual claims that can be verified or disputed, and validate each claim against the sources.
+
+SOURCES:
+{sources_json}
+
+Extract claims that are:
+- Specific and measurable (facts, statistics, historical or scientific claims, current events)
+- Potentially verifiable through other sources
+- Important for understanding the topic
+- Not subjective opinions or speculation
+
+For each claim and each source, determine whether the source SUPPORTS the claim,
+CONTRADICTS it, or provides NEUTRAL/INSUFFICIENT information, taking the source's
+credibility into account.
+
+Respond with only this JSON object, with one result per claim:
+{{
+    "results": [
+        {{
+            "claim": "A clear, verifiable statement",
+            "confidence": "high|medium|low",
+            "verification_status": "verified|partially_verified|unverified|disputed",
+            "supporting_sources": [list of source indices that support the claim],
+            "contradicting_sources": [list of source indices that contradict the claim],
+            "notes": "One sentence of context or limitations"
+        }}
+    ]
+}}
+
+{VALIDATION_GUIDE}"""
+
+        messages = [{"role": "user", "content": prompt}]
+        
+        async with self._semaphore:
+            response = await self.claude.generate_completion(
+                messages=messages,
+                max_tokens=FUSED_VALIDATION_MAX_TOKENS,
+                temperature=0.2  # Very low temperature for consistent validation
+            )
+        
+        try:
+            results = _loads(response).get("results")
+            if not isinstance(results, list):
+                raise ValueError("Response has no results list")
+        except (json.JSONDecodeError, AttributeError, ValueError) as e:
+            raise ValueError(f"Failed to parse extract-and-validate JSON: {e}") from e
+        
+        fact_checks = []
+        seen_claims = set()
+        for validation_data in results:
+            if not isinstance(validation_data, dict):
+                continue
+            claim = validation_data.get("claim")
+            if not isinstance(claim, str) or not claim.strip() or _claim_key(claim) in seen_claims:
+                continue
+            
+            claim = claim.strip()
+            seen_claims.add(_claim_key(claim))
+            self._set_cached_verdict(claim, sources_key, validation_data)
+            fact_checks.append(self._build_fact_check(claim, validation_data, sources))
+        
+        logger.info(f"Extracted and validated {len(fact_checks)} claims")
+        return fact_checks
+    
+    async def validate_all_claims(
+        self, 
+        sources: List[Source], 
+        fused: bool = True,
+        top_k: Optional[int] = None
+    ) -> List[FactCheck]:
         """
         Validate all claims extracted from sources.
         
         Args:
             sources: List of sources to analyze
+            fused: Extract and validate in one Claude call (extract_and_validate),
+                falling back to the two-stage path if that fails; False always
+                extracts first, then validates the claims in batches
+            top_k: Return only the top_k fact checks instead of all of them
             
         Returns:
-            List of FactCheck objects for all validated claims
+            FactCheck objects sorted by confidence, then verification status;
+            all validated claims, or the best top_k when given
             
         Raises:
             Exception: If validation process fails
@@ -278,41 +569,32 @@ Verification status:
         logger.info(f"Starting comprehensive fact-checking of {len(sources)} sources")
         
         try:
-            # Step 1: Extract all claims
-            claims = await self.extract_claims(sources)
+            # Serialized once (dates included) and shared by the fused and fallback paths
+            sources_json = self._serialize_sources(sources)
             
-            if not claims:
+            fact_checks = None
+            if fused:
+                try:
+                    fact_checks = await self.extract_and_validate(sources, sources_json)
+                except FATAL_API_ERRORS:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Fused fact-check failed, falling back to extract then validate: {e}")
+            
+            if fact_checks is None:
+                fact_checks = await self._extract_then_validate(sources, sources_json)
+            
+            if not fact_checks:
                 logger.warning("No claims extracted from sources")
                 return []
             
-            # Step 2: Validate each claim
-            fact_checks = []
-            for i, claim in enumerate(claims):
-                try:
-                    logger.info(f"Validating claim {i+1}/{len(claims)}: {claim[:50]}...")
-                    fact_check = await self.validate_claim(claim, sources)
-                    fact_checks.append(fact_check)
-                    
-                    # Add small delay to avoid rate limiting
-                    await asyncio.sleep(0.1)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to validate claim {i+1}: {str(e)}")
-                    # Create a fallback fact check for failed validations
-                    fallback_check = FactCheck(
-                        claim=claim,
-                        confidence=0.0,
-                        verification_status=VerificationStatus.UNVERIFIED,
-                        sources=[],
-                        notes=f"Validation failed: {str(e)}"
-                    )
-                    fact_checks.append(fallback_check)
-            
-            # Step 3: Sort by confidence and verification status
-            fact_checks.sort(
-                key=lambda x: (x.confidence, x.verification_status.value),
-                reverse=True
-            )
+            # Sort by confidence and verification status
+            # VerificationStatus is a str enum, so it compares by value
+            sort_key = attrgetter('confidence', 'verification_status')
+            if top_k is None:
+                fact_checks.sort(key=sort_key, reverse=True)
+            else:
+                fact_checks = heapq.nlargest(top_k, fact_checks, key=sort_key)
             
             logger.info(f"Fact-checking completed: {len(fact_checks)} claims validated")
             return fact_checks
@@ -321,6 +603,181 @@ Verification status:
             logger.error(f"Failed to validate all claims: {str(e)}")
             raise
     
+    async def _extract_then_validate(
+        self, 
+        sources: List[Source], 
+        sources_json: Optional[str] = None
+    ) -> List[FactCheck]:
+        """
+        Two-stage fact-check: extract claims, then validate them in concurrent batches.
+        
+        Args:
+            sources: List of sources to analyze
+            sources_json: Optional precomputed _serialize_sources(sources)
+            
+        Returns:
+            List of FactCheck objects in claim order
+        """
+        # Step 1: Extract all claims
+        extracted_claims = await self.extract_claims(sources)
+        
+        if not extracted_claims:
+            return []
+        
+        # Validate each distinct claim once; duplicates share its result
+        claim_positions: Dict[str, int] = {}
+        claims = []
+        for claim in extracted_claims:
+            key = _claim_key(claim)
+            if key not in claim_positions:
+                claim_positions[key] = len(claims)
+                claims.append(claim)
+        
+        if len(claims) < len(extracted_claims):
+            logger.info(f"Validating {len(claims)} distinct claims out of {len(extracted_claims)} extracted")
+        
+        # Serialize the sources once for every batch prompt
+        if sources_json is None:
+            sources_json = self._serialize_sources(sources)
+        
+        # Step 2: Validate the claims in batches, concurrently; the semaphore bounds API load
+        batches = [
+            claims[start:start + CLAIM_BATCH_SIZE]
+            for start in range(0, len(claims), CLAIM_BATCH_SIZE)
+        ]
+        
+        async def validate_batch(i: int, batch: List[str]) -> List[FactCheck]:
+            async with self._semaphore:
+                try:
+                    logger.info(f"Validating claim batch {i+1}/{len(batches)} ({len(batch)} claims)")
+                    return await self.validate_claims_batch(batch, sources, sources_json)
+                except FATAL_API_ERRORS:
+                    raise
+                except Exception as e:
+                    logger.error(f"Failed to validate claim batch {i+1}: {str(e)}")
+                    # Create fallback fact checks for failed validations
+                    return [
+                        FactCheck(
+                            claim=claim,
+                            confidence=0.0,
+                            verification_status=VerificationStatus.UNVERIFIED,
+                            sources=sources,
+                            notes=f"Validation failed: {str(e)}"
+                        )
+                        for claim in batch
+                    ]
+        
+        # A fatal error cancels the sibling batches still waiting on Claude
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(validate_batch(i, batch)) for i, batch in enumerate(batches)]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+        fact_checks = [fact_check for task in tasks for fact_check in task.result()]
+        
+        # One FactCheck per extracted claim, in extraction order
+        results = []
+        for claim in extracted_claims:
+            fact_check = fact_checks[claim_positions[_claim_key(claim)]]
+            if fact_check.claim != claim:
+                fact_check = fact_check.model_copy(update={"claim": claim})
+            results.append(fact_check)
+        return results
+    
+    @staticmethod
+    def _serialize_sources(sources: List[Source], include_date: bool = True) -> str:
+        """
+        Describe sources as compact JSON for a prompt.
+        
+        Args:
+            sources: Sources to describe
+            include_date: Include each source's published date
+            
+        Returns:
+            JSON array with one object per source, indexed by position
+        """
+        # pydantic-core copies the fields and formats published_date natively
+        fields = PROMPT_SOURCE_FIELDS | {"published_date"} if include_date else PROMPT_SOURCE_FIELDS
+        source_analysis = [
+            {"index": i, **source.model_dump(mode="json", include=fields)}
+            for i, source in enumerate(sources)
+        ]
+        
+        # Compact, unindented JSON: indentation only costs prompt tokens
+        return _dumps(source_analysis)
+    
+    @staticmethod
+    def _sources_key(sources_json: str) -> str:
+        """Hash serialized sources (URLs, summaries, credibility) into a verdict cache key."""
+        return hashlib.blake2b(sources_json.encode(), digest_size=16).hexdigest()
+    
+    def _get_cached_verdict(self, claim: str, sources_key: str) -> Optional[Verdict]:
+        """Return the cached verdict for a claim against a source set if it has not expired."""
+        key = (claim, sources_key)
+        entry = self._verdict_cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, verdict = entry
+        if time.monotonic() - stored_at > VERDICT_CACHE_TTL:
+            del self._verdict_cache[key]
+            return None
+        
+        self._verdict_cache.move_to_end(key)
+        return verdict
+    
+    def _set_cached_verdict(self, claim: str, sources_key: str, verdict: Verdict):
+        """Cache a verdict, evicting the least recently used entry when full."""
+        key = (claim, sources_key)
+        self._verdict_cache[key] = (time.monotonic(), verdict)
+        self._verdict_cache.move_to_end(key)
+        if len(self._verdict_cache) > VERDICT_CACHE_MAXSIZE:
+            self._verdict_cache.popitem(last=False)
+    
+    @staticmethod
+    def _build_fact_check(
+        claim: str, 
+        validation_data: Verdict, 
+        sources: List[Source]
+    ) -> FactCheck:
+        """
+        Turn Claude's verdict for a claim into a FactCheck.
+        
+        Args:
+            claim: The validated claim
+            validation_data: Parsed verdict with confidence, status and source indices
+            sources: Sources the verdict's indices refer to
+            
+        Returns:
+            FactCheck object for the claim
+        """
+        # Map confidence string to numeric value
+        confidence = CONFIDENCE_MAP.get(validation_data.get("confidence", "low"), 0.3)
+        
+        # Map verification status
+        verification_status = STATUS_MAP.get(
+            validation_data.get("verification_status", "unverified"),
+            VerificationStatus.UNVERIFIED
+        )
+        
+        # Get relevant sources based on validation results
+        supporting_indices = validation_data.get("supporting_sources", [])
+        contradicting_indices = validation_data.get("contradicting_sources", [])
+        
+        relevant_sources = []
+        for idx in supporting_indices + contradicting_indices:
+            if isinstance(idx, int) and 0 <= idx < len(sources):
+                relevant_sources.append(sources[idx])
+        
+        return FactCheck(
+            claim=claim,
+            confidence=confidence,
+            verification_status=verification_status,
+            # FactCheck requires sources; a verdict citing none was checked against all of them
+            sources=relevant_sources or sources,
+            notes=validation_data.get("notes", "")
+        )
+    
     def _extract_claims_from_text(self, text: str) -> List[str]:
         """
         Fallback method to extract claims from text response.
@@ -333,20 +790,8 @@ Verification status:
         """
         logger.warning("Using fallback claim extraction from text")
         
-        # Simple extraction logic - look for numbered items or bullet points
-        lines = text.split('\n')
-        claims = []
-        
-        for line in lines:
-            line = line.strip()
-            # Look for numbered items (1., 2., etc.) or bullet points (-, •)
-            if (line and 
-                (line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')) or
-                 line.startswith(('-', '•', '*')))):
-                # Remove numbering/bullets and clean
-                claim = line.split('.', 1)[-1].strip() if '.' in line else line[1:].strip()
-                if claim:
-                    claims.append(claim)
+        # Numbered items or bullet points, with the numbering/bullet removed
+        claims = [match.group(1) for match in _CLAIM_LINE_RE.finditer(text)]
         
         return claims[:10]  # Limit to 10 claims for fallback
     
@@ -363,7 +808,7 @@ Verification status:
             sources: Available sources
             
         Returns:
-            Basic FactCheck object
+            Basic FactCheck object, listing the sources it was checked against
         """
         logger.warning(f"Creating fallback fact check for claim: {claim[:50]}...")
         
@@ -371,7 +816,7 @@ Verification status:
             claim=claim,
             confidence=0.0,
             verification_status=VerificationStatus.UNVERIFIED,
-            sources=[],
+            sources=sources,
             notes="Validation failed - using fallback result"
         )
     
@@ -388,17 +833,43 @@ Verification status:
         if not fact_checks:
             return {"total_claims": 0, "summary": "No claims to analyze"}
         
-        # Calculate statistics
+        # Calculate statistics and find the most/least confident claims in one pass
         total_claims = len(fact_checks)
-        verified_count = sum(1 for fc in fact_checks if fc.verification_status == VerificationStatus.VERIFIED)
-        disputed_count = sum(1 for fc in fact_checks if fc.verification_status == VerificationStatus.DISPUTED)
-        unverified_count = sum(1 for fc in fact_checks if fc.verification_status == VerificationStatus.UNVERIFIED)
-        
-        avg_confidence = sum(fc.confidence for fc in fact_checks) / total_claims
+        if np is not None and total_claims >= VECTORIZED_SUMMARY_MIN_CLAIMS:
+            confidences = np.fromiter((fc.confidence for fc in fact_checks), dtype=np.float64, count=total_claims)
+            status_codes = np.fromiter(
+                (STATUS_CODES[fc.verification_status] for fc in fact_checks), dtype=np.int8, count=total_claims
+            )
+            status_counts = np.bincount(status_codes, minlength=len(STATUS_CODES))
+            
+            verified_count = int(status_counts[STATUS_CODES[VerificationStatus.VERIFIED]])
+            disputed_count = int(status_counts[STATUS_CODES[VerificationStatus.DISPUTED]])
+            unverified_count = int(status_counts[STATUS_CODES[VerificationStatus.UNVERIFIED]])
+            total_confidence = float(confidences.sum())
+            most_confident = fact_checks[int(confidences.argmax())]
+            least_confident = fact_checks[int(confidences.argmin())]
+        else:
+            verified_count = disputed_count = unverified_count = 0
+            total_confidence = 0.0
+            most_confident = least_confident = fact_checks[0]
+            
+            for fc in fact_checks:
+                status = fc.verification_status
+                if status is VerificationStatus.VERIFIED:
+                    verified_count += 1
+                elif status is VerificationStatus.DISPUTED:
+                    disputed_count += 1
+                elif status is VerificationStatus.UNVERIFIED:
+                    unverified_count += 1
+                
+                confidence = fc.confidence
+                total_confidence += confidence
+                if confidence > most_confident.confidence:
+                    most_confident = fc
+                if confidence < least_confident.confidence:
+                    least_confident = fc
         
-        # Find most/least confident claims
-        most_confident = max(fact_checks, key=lambda x: x.confidence)
-        least_confident = min(fact_checks, key=lambda x: x.confidence)
+        avg_confidence = total_confidence / total_claims
         
         summary = {
             "total_claims": total_claims,
@@ -422,3 +893,23 @@ Verification status:
         
         logger.info(f"Validation summary: {verified_count}/{total_claims} claims verified")
         return summary
+
+
+_fact_checker: Optional[FactChecker] = None
+
+
+async def get_fact_checker() -> FactChecker:
+    """
+    Return the shared fact checker, creating it on first use.
+    
+    Takes no arguments so it can be used directly as a FastAPI dependency.
+    Sharing one instance lets every request use the same verdict cache and
+    claim-validation concurrency limit.
+    
+    Returns:
+        The process-wide FactChecker, built on the shared Claude service
+    """
+    global _fact_checker
+    if _fact_checker is None:
+        _fact_checker = FactChecker(await get_claude_service())
+    return _fact_checker
@@ -3,15 +3,20 @@ Main PodcastGenerator class that orchestrates the entire podcast generation pipe
 Integrates user preferences, research, fact-checking, and content generation.
 """
 
+import os
 import logging
 import asyncio
 import json
-from typing import List, Dict, Any, Optional, Tuple
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 import backoff
 from urllib.parse import urlparse
-import hashlib
+import heapq
 import time
+import functools
+from collections import OrderedDict, defaultdict
 
 from .types import (
     GenerationRequest, UserPreferences, Source, FactCheck, 
@@ -20,10 +25,46 @@ from .types import (
 from .claude_service import ClaudePodcastService
 from .fact_checker import FactChecker
 
+try:
+    import orjson
+except ImportError:  # Optional dependency; falls back to the stdlib json module
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _loads(data: str) -> Any:
+    """Parse JSON, using orjson when installed; errors are json.JSONDecodeError either way."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to JSON, using orjson when installed; unknown types become strings."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _publication_for_netloc(netloc: str) -> str:
+    """Name the publication behind a host; cached, since sources repeat a few hosts."""
+    domain = netloc.lower()
+    
+    # Remove common prefixes
+    domain = domain.replace("www.", "").replace("m.", "")
+    
+    # Extract main domain name
+    parts = domain.split(".")
+    if len(parts) >= 2:
+        # Return main domain (e.g., "techcrunch" from "techcrunch.com")
+        return parts[-2].title()
+    
+    return domain.title()
+
+
 class ResearchConfig:
     """Performance tuning configuration for research pipeline."""
     
@@ -35,6 +76,7 @@ class ResearchConfig:
     # Fetch configuration  
     MAX_SOURCES_TO_FETCH = 8  # Reduced from 12
     FETCH_TIMEOUT = 8         # Seconds per fetch
+    FETCH_STRAGGLER_GRACE = 2 # Seconds to wait for slow fetches once MIN_SOURCES_FETCHED are in
     MAX_CONTENT_LENGTH = 5000 # Characters per article
     
     # Verification
@@ -45,25 +87,94 @@ class ResearchConfig:
     # Caching
     SEARCH_CACHE_TTL = 30     # Minutes
     FETCH_CACHE_TTL = 60      # Minutes
+    CACHE_MAX_ENTRIES = 512   # Searches and fetches kept, least recently used evicted first
+    CACHE_SWEEP_INTERVAL = 300  # Seconds between sweeps of expired cache entries
+    PREWARM_TOPICS = 3        # A user's top interests researched ahead of generation
+    PREWARM_CONCURRENCY = 2   # Topics prewarmed at once, to leave room for live requests
+    # SQLite file shared by workers and restarts; unset keeps the cache in-process only
+    CACHE_DB_PATH = os.getenv("PODCAST_CACHE_DB")
     
     # Quality thresholds
     MIN_SOURCES_FETCHED = 4   # Fail if less than 4 sources work
     MIN_EVENTS_EXTRACTED = 4  # Fail if less than 4 events found
 
 
+class SQLiteCacheStore:
+    """
+    Persistent key-value store for SearchCache, shared across processes and restarts.
+    
+    Values are stored as JSON with their wall-clock write time; methods block
+    and are meant to be called through asyncio.to_thread.
+    """
+    
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            # WAL lets other worker processes read while one writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+    
+    def get(self, key: str, max_age_seconds: float) -> Optional[Any]:
+        """Return the stored value for a key if it is younger than max_age_seconds."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM search_cache WHERE key = ? AND stored_at > ?",
+                (key, time.time() - max_age_seconds)
+            ).fetchone()
+        return _loads(row[0]) if row else None
+    
+    def set(self, key: str, value: Any):
+        """Store a value, replacing any previous one for the key."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, stored_at, value) VALUES (?, ?, ?)",
+                (key, time.time(), _dumps(value))
+            )
+    
+    def delete_older_than(self, max_age_seconds: float):
+        """Delete values older than max_age_seconds."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE stored_at <= ?",
+                (time.time() - max_age_seconds,)
+            )
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 class SearchCache:
-    """Simple in-memory cache with TTL for search results and fetched content."""
+    """
+    In-memory LRU cache with TTL for search results and fetched content.
+    
+    With a SQLiteCacheStore, get_or_compute also reads and writes through to
+    it, so other workers and later processes reuse the results.
+    """
     
-    def __init__(self):
-        self._cache = {}
+    def __init__(self, max_size: int = 512, store: Optional[SQLiteCacheStore] = None):
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # (stored_at, key) min-heap, so clear_old only visits expired entries
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._max_size = max_size
+        self._store = store
+        # Lookups being computed, so concurrent misses on a key share one request
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._hits = 0
         self._misses = 0
     
     def get(self, key: str, ttl_minutes: int = 30) -> Optional[Any]:
         """Get cached value if not expired."""
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            if datetime.now() - timestamp < timedelta(minutes=ttl_minutes):
+        entry = self._cache.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if time.monotonic() - stored_at < ttl_minutes * 60:
+                self._cache.move_to_end(key)
                 self._hits += 1
                 return value
             else:
@@ -73,16 +184,117 @@ class SearchCache:
         return None
     
     def set(self, key: str, value: Any):
-        """Cache value with timestamp."""
-        self._cache[key] = (value, datetime.now())
+        """Cache value with timestamp, evicting the least recently used entry when full."""
+        stored_at = time.monotonic()
+        self._cache[key] = (stored_at, value)
+        self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (stored_at, key))
+        
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        
+        # Overwritten and evicted keys leave stale heap entries; rebuild once they dominate
+        if len(self._expiry_heap) > 2 * self._max_size:
+            self._expiry_heap = [(stored_at, key) for key, (stored_at, _) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    async def get_or_compute(
+        self, 
+        key: str, 
+        compute: Callable[[], Awaitable[Any]], 
+        ttl_minutes: int = 30
+    ) -> Any:
+        """
+        Get a cached value, or compute it once for all concurrent callers.
+        
+        Args:
+            key: Cache key
+            compute: Produces the value on a miss; None results aren't cached
+            ttl_minutes: Maximum age of a cached value
+            
+        Returns:
+            The cached or computed value
+            
+        Raises:
+            Exception: Whatever compute raised, for every caller awaiting it
+        """
+        # None is the miss signal (it is never cached); empty results are real hits
+        cached = self.get(key, ttl_minutes=ttl_minutes)
+        if cached is not None:
+            return cached
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # The caller computing the value was cancelled; compute it here instead,
+                # unless this caller is being cancelled too
+                if asyncio.current_task().cancelling():
+                    raise
+                return await self.get_or_compute(key, compute, ttl_minutes)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load_persisted(key, ttl_minutes)
+            if value is None:
+                value = await compute()
+                if value is not None:
+                    await self._persist(key, value)
+            if value is not None:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved here, so a future nobody awaited doesn't warn
+            raise
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                future.cancel()
+    
+    async def _load_persisted(self, key: str, ttl_minutes: int) -> Optional[Any]:
+        """Read a value from the persistent store, if there is one; store errors count as misses."""
+        if self._store is None:
+            return None
+        try:
+            return await asyncio.to_thread(self._store.get, key, ttl_minutes * 60)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Persistent cache read failed for {key}: {e}")
+            return None
+    
+    async def _persist(self, key: str, value: Any):
+        """Write a value to the persistent store, if there is one; store errors are logged."""
+        if self._store is None:
+            return
+        try:
+            await asyncio.to_thread(self._store.set, key, value)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Persistent cache write failed for {key}: {e}")
     
-    def clear_old(self, max_age_minutes: int = 60):
+    async def clear_old(self, max_age_minutes: int = 60):
         """Clear entries older than max_age."""
-        cutoff = datetime.now() - timedelta(minutes=max_age_minutes)
-        self._cache = {
-            k: v for k, v in self._cache.items() 
-            if v[1] > cutoff
-        }
+        cutoff = time.monotonic() - max_age_minutes * 60
+        while self._expiry_heap and self._expiry_heap[0][0] <= cutoff:
+            stored_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._cache.get(key)
+            # Skip keys that were set again since this heap entry was pushed
+            if entry is not None and entry[0] == stored_at:
+                del self._cache[key]
+        
+        if self._store is not None:
+            try:
+                await asyncio.to_thread(self._store.delete_older_than, max_age_minutes * 60)
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache cleanup failed: {e}")
+    
+    async def close(self):
+        """Close the persistent store, if there is one."""
+        if self._store is not None:
+            store, self._store = self._store, None
+            await asyncio.to_thread(store.close)
     
     def stats(self) -> Dict[str, int]:
         """Return cache statistics."""
@@ -96,6 +308,57 @@ class SearchCache:
         }
 
 
+# Shared by every PodcastGenerator in the process, so the LRU bound, expiry sweep
+# and in-flight sharing span requests (the router builds a generator per request)
+_search_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> SearchCache:
+    """
+    Return the shared search cache, creating it on first use.
+    
+    The cache is backed by a SQLiteCacheStore when PODCAST_CACHE_DB is set.
+    
+    Returns:
+        The process-wide SearchCache instance
+    """
+    global _search_cache
+    if _search_cache is None:
+        db_path = ResearchConfig.CACHE_DB_PATH
+        _search_cache = SearchCache(
+            max_size=ResearchConfig.CACHE_MAX_ENTRIES,
+            store=SQLiteCacheStore(db_path) if db_path else None
+        )
+    return _search_cache
+
+
+async def sweep_search_cache(interval_seconds: float = ResearchConfig.CACHE_SWEEP_INTERVAL):
+    """
+    Periodically drop expired entries from the shared search cache.
+    
+    Runs until cancelled; start it as a task at app startup.
+    
+    Args:
+        interval_seconds: Seconds between sweeps
+    """
+    # Nothing outlives the longest TTL, whichever lookup it was stored for
+    max_age_minutes = max(ResearchConfig.SEARCH_CACHE_TTL, ResearchConfig.FETCH_CACHE_TTL)
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await get_search_cache().clear_old(max_age_minutes=max_age_minutes)
+        except Exception as e:
+            logger.warning(f"Search cache sweep failed: {e}")
+
+
+async def shutdown_search_cache():
+    """Close the shared search cache's persistent store, if one was created."""
+    global _search_cache
+    if _search_cache is not None:
+        cache, _search_cache = _search_cache, None
+        await cache.close()
+
+
 class PodcastGenerator:
     """
     Main orchestrator for podcast generation pipeline.
@@ -108,7 +371,8 @@ class PodcastGenerator:
         self, 
         supabase_client, 
         claude_service: ClaudePodcastService, 
-        fact_checker: FactChecker
+        fact_checker: FactChecker,
+        search_cache: Optional[SearchCache] = None
     ):
         """
         Initialize the podcast generator.
@@ -117,15 +381,53 @@ class PodcastGenerator:
             supabase_client: Supabase client for database operations
             claude_service: Claude service for AI operations
             fact_checker: Fact checker for content validation
+            search_cache: Cache for searches and fetches; defaults to the
+                process-wide one from get_search_cache
         """
         self.supabase = supabase_client
         self.claude = claude_service
         self.fact_checker = fact_checker
-        self.search_cache = SearchCache()
         self.config = ResearchConfig()
+        self.search_cache = search_cache if search_cache is not None else get_search_cache()
         
         logger.info("PodcastGenerator initialized with performance optimizations")
     
+    async def prewarm(self, user_id: str, timeframe: str = "this week") -> int:
+        """
+        Research a user's top interests ahead of time to fill the search cache.
+        
+        Meant for a background scheduler: the searches and fetches made by
+        discover_news_events are cached, so a later generate_podcast on these
+        topics starts warm. Failures are logged, not raised.
+        
+        Args:
+            user_id: User whose interests to research
+            timeframe: Time window, matching what generation will request
+            
+        Returns:
+            Number of topics researched successfully
+        """
+        user_context = await self.load_user_context(user_id)
+        weights = user_context["interest_weights"]
+        topics = sorted(weights, key=weights.get, reverse=True)[:self.config.PREWARM_TOPICS]
+        if not topics:
+            return 0
+        
+        logger.info(f"Prewarming research cache for user {user_id}: {topics}")
+        semaphore = asyncio.Semaphore(self.config.PREWARM_CONCURRENCY)
+        
+        async def prewarm_topic(topic: str) -> bool:
+            async with semaphore:
+                try:
+                    await self.discover_news_events(topic, timeframe)
+                    return True
+                except Exception as e:
+                    logger.warning(f"Prewarm failed for topic '{topic}': {e}")
+                    return False
+        
+        results = await asyncio.gather(*(prewarm_topic(topic) for topic in topics))
+        return sum(results)
+    
     async def generate_podcast(
         self, 
         request: GenerationRequest,
@@ -187,83 +489,78 @@ class PodcastGenerator:
                     logger.info(f"Discovered {len(discovered_events)} events, verified {len(verified_events)}")
                     
                     # Convert events to Source objects for compatibility with existing pipeline
+                    events_by_topic = defaultdict(list)
                     for event in discovered_events:
+                        events_by_topic[event.get("research_topic")].append(event)
                         for url in event.get("source_urls", [])[:1]:  # Take first URL
-                            source = Source(
-                                url=url,
-                                title=event.get("event", "Event"),
-                                publication=self._extract_publication_from_url(url),
-                                credibility_score=event.get("credibility_score", 5.0) / 10.0,  # Convert 0-10 to 0-1
-                                content_summary=self._format_event_as_summary(event),
-                                published_date=datetime.utcnow()
-                            )
-                            all_sources.append(source)
+                            all_sources.append(self._event_to_source(event, url))
                     
-                    # Organize by segment
+                    # Organize by segment; segments sharing a topic share its sources.
+                    # These are separate from all_sources, whose summaries Step 3 replaces.
+                    sources_by_topic: Dict[str, List[Source]] = {}
                     for segment in request.segments:
                         if segment.topics:
                             for topic in segment.topics:
-                                # Find events related to this topic
-                                related_events = [
-                                    e for e in discovered_events 
-                                    if e.get("research_topic") == topic
-                                ]
-                                
-                                # Convert to sources
-                                topic_sources = []
-                                for event in related_events[:5]:  # Top 5 events per topic
-                                    for url in event.get("source_urls", [])[:1]:
-                                        source = Source(
-                                            url=url,
-                                            title=event.get("event", "Event"),
-                                            publication=self._extract_publication_from_url(url),
-                                            credibility_score=event.get("credibility_score", 5.0) / 10.0,
-                                            content_summary=self._format_event_as_summary(event),
-                                            published_date=datetime.utcnow()
-                                        )
-                                        topic_sources.append(source)
-                                
-                                segment_research[f"{segment.type.value}_{topic}"] = topic_sources
+                                if topic not in sources_by_topic:
+                                    sources_by_topic[topic] = [
+                                        self._event_to_source(event, url)
+                                        for event in events_by_topic.get(topic, [])[:5]  # Top 5 events per topic
+                                        for url in event.get("source_urls", [])[:1]
+                                    ]
+                                segment_research[f"{segment.type.value}_{topic}"] = sources_by_topic[topic]
                 else:
                     logger.warning("No topics provided for event discovery")
             else:
                 # OLD: Traditional article-based research
                 logger.info("Using TRADITIONAL article-based research")
             
-            for segment in request.segments:
-                if segment.topics:
-                    for topic in segment.topics:
-                        logger.info(f"Researching topic: {topic}")
-                        sources = await self.search_multi_source(topic, min_sources=3)
-                        all_sources.extend(sources)
-                        segment_research[f"{segment.type.value}_{topic}"] = sources
-            
-            # Step 3: Fetch full content from sources
-            logger.info("Step 3: Fetching full content from sources")
-            enriched_sources = []
-            for source in all_sources:
-                try:
-                    content_data = await self.claude.web_fetch(source.url)
-                    if content_data.get("success"):
-                        # Update source with fetched content
-                        source.content_summary = content_data["content"][:1000]  # Truncate for storage
-                        enriched_sources.append(source)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch content from {source.url}: {e}")
-                    enriched_sources.append(source)  # Keep original source
+            # Search every distinct topic concurrently, bounded like the event pipeline's searches
+            segment_topics = [
+                (segment, topic)
+                for segment in request.segments
+                for topic in (segment.topics or [])
+            ]
+            search_semaphore = asyncio.Semaphore(self.config.MAX_SEARCH_QUERIES)
             
-            # Step 4: Validate facts using fact checker
-            logger.info("Step 4: Validating facts")
-            try:
-                fact_checks = await self.fact_checker.validate_all_claims(enriched_sources)
-            except Exception as e:
-                logger.warning(f"Fact checking failed, continuing without fact checks: {e}")
-                fact_checks = []  # Continue without fact checks if it fails
+            async def research_topic(topic: str) -> List[Source]:
+                async with search_semaphore:
+                    logger.info(f"Researching topic: {topic}")
+                    return await self.search_multi_source(topic, min_sources=3)
+            
+            topics = list(dict.fromkeys(topic for _, topic in segment_topics))
+            topic_sources = dict(zip(topics, await asyncio.gather(*(research_topic(topic) for topic in topics))))
             
-            # Step 5: Build continuity context
-            logger.info("Step 5: Building continuity context")
+            for segment, topic in segment_topics:
+                sources = topic_sources[topic]
+                all_sources.extend(sources)
+                segment_research[f"{segment.type.value}_{topic}"] = sources
+            
+            # Continuity only needs the user's past episodes, so it loads while
+            # sources are fetched and fact-checked
             topics = [topic for segment in request.segments for topic in (segment.topics or [])]
-            continuity_context = await self.build_continuity_context(request.user_id, topics)
+            continuity_task = asyncio.create_task(self.build_continuity_context(request.user_id, topics))
+            
+            try:
+                # Step 3: Fetch full content from sources
+                logger.info("Step 3: Fetching full content from sources")
+                enriched_sources = await self._enrich_sources(all_sources)
+                
+                # Step 4: Validate facts using fact checker
+                logger.info("Step 4: Validating facts")
+                try:
+                    fact_checks = await self.fact_checker.validate_all_claims(enriched_sources)
+                except Exception as e:
+                    logger.warning(f"Fact checking failed, continuing without fact checks: {e}")
+                    fact_checks = []  # Continue without fact checks if it fails
+                
+                # Step 5: Build continuity context
+                logger.info("Step 5: Building continuity context")
+                continuity_context = await continuity_task
+            except BaseException:
+                # Don't leave the continuity load running, or its error unretrieved, when a step fails
+                continuity_task.cancel()
+                await asyncio.gather(continuity_task, return_exceptions=True)
+                raise
             
             # Step 6: Generate script using Claude
             logger.info("Step 6: Generating podcast script")
@@ -284,17 +581,18 @@ class PodcastGenerator:
             
             # Step 8: Prepare podcast data for database
             logger.info("Step 8: Preparing podcast data")
+            script_data = livekit_script.model_dump()
             podcast_data = {
                 "user_id": request.user_id,
                 "title": self._generate_podcast_title(request, user_context),
                 "description": self._generate_podcast_description(request, user_context),
                 "format": request.format.value,
                 "total_duration": request.duration_minutes,
-                "script": livekit_script.dict(),
-                "sources": [source.dict() for source in enriched_sources],
-                "fact_checks": [fc.dict() for fc in fact_checks],
+                "script": script_data,
+                "sources": [source.model_dump() for source in enriched_sources],
+                "fact_checks": [fc.model_dump() for fc in fact_checks],
                 "interactive_elements": interactive_elements,
-                "user_preferences": user_context["preferences"].dict(),
+                "user_preferences": user_context["preferences"].model_dump(),
                 "events_discovered": discovered_events,  # ADD THIS for topic extraction
                 "generation_metadata": {
                     "generated_at": datetime.utcnow().isoformat(),
@@ -314,7 +612,7 @@ class PodcastGenerator:
             result = {
                 "podcast_id": podcast_id,
                 "status": "completed",
-                "livekit_script": livekit_script.dict(),
+                "livekit_script": script_data,
                 "metadata": podcast_data["generation_metadata"],
                 "summary": {
                     "title": podcast_data["title"],
@@ -332,6 +630,33 @@ class PodcastGenerator:
             logger.error(f"Podcast generation failed: {str(e)}")
             raise
     
+    async def _enrich_sources(self, sources: List[Source]) -> List[Source]:
+        """
+        Replace source summaries with their fetched content, fetching concurrently.
+        
+        Args:
+            sources: Sources from research
+            
+        Returns:
+            Sources in their original order; ones whose fetch raised or ran past
+            FETCH_TIMEOUT are kept as-is, ones whose fetch was unsuccessful are dropped
+        """
+        fetch_results = await self.claude.web_fetch_many(
+            [source.url for source in sources],
+            timeout=self.config.FETCH_TIMEOUT
+        )
+        enriched_sources = []
+        for source, content_data in zip(sources, fetch_results):
+            # gather(return_exceptions=True) also returns CancelledError, which isn't an Exception
+            if isinstance(content_data, BaseException):
+                logger.warning(f"Failed to fetch content from {source.url}: {content_data}")
+                enriched_sources.append(source)  # Keep original source
+            elif content_data.get("success"):
+                # Update source with fetched content
+                source.content_summary = content_data["content"][:1000]  # Truncate for storage
+                enriched_sources.append(source)
+        return enriched_sources
+    
     @backoff.on_exception(
         backoff.expo,
         Exception,
@@ -416,20 +741,18 @@ class PodcastGenerator:
             # Execute ALL searches simultaneously with timeout
             async def search_with_timeout(query: str) -> List[dict]:
                 """Execute single search with timeout and caching."""
-                cache_key = f"search:{hashlib.md5(query.encode()).hexdigest()}"
-                
-                # Check cache first
-                cached = self.search_cache.get(cache_key, ttl_minutes=self.config.SEARCH_CACHE_TTL)
-                if cached:
-                    logger.info(f"💾 Cache hit: {query}")
-                    return cached
+                cache_key = f"search:{query}"
                 
-                try:
+                async def search() -> List[Dict[str, Any]]:
                     async with asyncio.timeout(self.config.SEARCH_TIMEOUT):
                         results = await self.claude.web_search(query)
-                        top_results = results[:self.config.RESULTS_PER_QUERY]
-                        self.search_cache.set(cache_key, top_results)
-                        return top_results
+                        return results[:self.config.RESULTS_PER_QUERY]
+                
+                # Cached, and shared with concurrent searches for the same query
+                try:
+                    return await self.search_cache.get_or_compute(
+                        cache_key, search, ttl_minutes=self.config.SEARCH_CACHE_TTL
+                    )
                 except asyncio.TimeoutError:
                     logger.warning(f"⏱️  Search timeout: {query}")
                     return []
@@ -476,15 +799,9 @@ class PodcastGenerator:
             async def fetch_with_timeout_cached(article: dict) -> Optional[dict]:
                 """Fetch single source with timeout and caching."""
                 url = article["url"]
-                cache_key = f"fetch:{hashlib.md5(url.encode()).hexdigest()}"
-                
-                # Check cache first
-                cached = self.search_cache.get(cache_key, ttl_minutes=self.config.FETCH_CACHE_TTL)
-                if cached:
-                    logger.debug(f"💾 Cache hit: {url}")
-                    return cached
+                cache_key = f"fetch:{url}"
                 
-                try:
+                async def fetch() -> Optional[dict]:
                     async with asyncio.timeout(self.config.FETCH_TIMEOUT):
                         content_data = await self.claude.web_fetch(url)
                         
@@ -498,15 +815,17 @@ class PodcastGenerator:
                         if word_count < 200:
                             return None
                         
-                        result = {
+                        return {
                             **article,
                             "content": content[:self.config.MAX_CONTENT_LENGTH],
                             "word_count": word_count
                         }
-                        
-                        self.search_cache.set(cache_key, result)
-                        return result
-                        
+                
+                # Cached, and shared with concurrent fetches of the same URL
+                try:
+                    return await self.search_cache.get_or_compute(
+                        cache_key, fetch, ttl_minutes=self.config.FETCH_CACHE_TTL
+                    )
                 except asyncio.TimeoutError:
                     logger.warning(f"⏱️  Fetch timeout: {url}")
                     return None
@@ -515,12 +834,30 @@ class PodcastGenerator:
                     return None
             
             fetch_start = time.time()
-            articles = await asyncio.gather(*[
-                fetch_with_timeout_cached(article) for article in top_articles
-            ])
+            fetch_tasks = [
+                asyncio.create_task(fetch_with_timeout_cached(article)) for article in top_articles
+            ]
             
-            # Filter out None results
-            enriched_articles = [a for a in articles if a is not None]
+            # Once enough articles have content, give the stragglers a short grace
+            # period instead of waiting out the full FETCH_TIMEOUT
+            pending = set(fetch_tasks)
+            usable = 0
+            while pending and usable < self.config.MIN_SOURCES_FETCHED:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                usable += sum(1 for task in done if task.result() is not None)
+            
+            if pending:
+                _, pending = await asyncio.wait(pending, timeout=self.config.FETCH_STRAGGLER_GRACE)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    logger.info(f"⏭️  Skipped {len(pending)} slow fetches")
+            
+            # Filter out None results, keeping relevance order
+            enriched_articles = [
+                task.result() for task in fetch_tasks
+                if task not in pending and task.result() is not None
+            ]
             
             fetch_time = time.time() - fetch_start
             logger.info(f"✅ Fetched {len(enriched_articles)}/{len(top_articles)} articles in {fetch_time:.1f}s")
@@ -542,9 +879,10 @@ class PodcastGenerator:
             if len(events) < self.config.MIN_EVENTS_EXTRACTED:
                 logger.warning(f"⚠️  Only {len(events)} events found (min: {self.config.MIN_EVENTS_EXTRACTED})")
             
-            # Add credibility scores
+            # Add credibility scores; source quality is the same for every event
+            source_quality = self._average_relevance(enriched_articles)
             for event in events:
-                event["credibility_score"] = self._calculate_event_credibility(event, enriched_articles)
+                event["credibility_score"] = self._calculate_event_credibility(event, source_quality)
             
             # Sort by credibility
             events.sort(key=lambda x: x.get("credibility_score", 0), reverse=True)
@@ -843,14 +1181,12 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON."""
                 # Single focused search
                 verify_query = f"{event['event']} {event.get('date', '')}"
                 
-                cache_key = f"search:{hashlib.md5(verify_query.encode()).hexdigest()}"
-                cached = self.search_cache.get(cache_key, ttl_minutes=self.config.SEARCH_CACHE_TTL)
-                
-                if cached:
-                    results = cached
-                else:
-                    results = await self.claude.web_search(verify_query)
-                    self.search_cache.set(cache_key, results)
+                cache_key = f"search:{verify_query}"
+                results = await self.search_cache.get_or_compute(
+                    cache_key,
+                    lambda: self.claude.web_search(verify_query),
+                    ttl_minutes=self.config.SEARCH_CACHE_TTL
+                )
                 
                 # Check if top 2 results mention key facts
                 mentions = 0
@@ -964,14 +1300,18 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON."""
                 "continuity_notes": []
             }
             
-            # Query for recent podcasts with similar topics
+            # Query for recent podcasts with similar topics, off the event loop.
+            # The query doesn't depend on the topic, so it runs once for all of them.
+            if topics:
+                similar_podcasts = await asyncio.to_thread(
+                    lambda: self.supabase.table("podcasts").select(
+                        "id, title, created_at"
+                    ).eq("user_id", user_id).order(
+                        "created_at", desc=True
+                    ).limit(3).execute()
+                )
+            
             for topic in topics:
-                similar_podcasts = self.supabase.table("podcasts").select(
-                    "id, title, created_at"
-                ).eq("user_id", user_id).order(
-                    "created_at", desc=True
-                ).limit(3).execute()
-                
                 continuity_data["recent_episodes"].extend(similar_podcasts.data)
                 continuity_data["topic_coverage"][topic] = len(similar_podcasts.data)
             
@@ -1204,7 +1544,7 @@ Format as JSON array with detailed objects."""
             
             # Parse interactive elements
             try:
-                elements = json.loads(response)
+                elements = _loads(response)
                 if not isinstance(elements, list):
                     elements = [elements]
                 
@@ -1705,19 +2045,7 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON ARRAY.
             Publication name
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Remove common prefixes
-            domain = domain.replace("www.", "").replace("m.", "")
-            
-            # Extract main domain name
-            parts = domain.split(".")
-            if len(parts) >= 2:
-                # Return main domain (e.g., "techcrunch" from "techcrunch.com")
-                return parts[-2].title()
-            
-            return domain.title()
+            return _publication_for_netloc(urlparse(url).netloc)
         except Exception:
             return "Unknown"
     
@@ -1761,7 +2089,7 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON ARRAY.
         """
         try:
             # Try to parse as JSON directly
-            events = json.loads(response)
+            events = _loads(response)
             
             if isinstance(events, dict):
                 # If single event, wrap in list
@@ -1798,7 +2126,7 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON ARRAY.
                 # Try to find JSON array pattern
                 json_match = re.search(r'\[\s*\{.*?\}\s*\]', response, re.DOTALL)
                 if json_match:
-                    events = json.loads(json_match.group(0))
+                    events = _loads(json_match.group(0))
                     if isinstance(events, list):
                         logger.info(f"Extracted {len(events)} events from markdown")
                         return events
@@ -1806,7 +2134,7 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON ARRAY.
                 # Try to find JSON object pattern
                 json_match = re.search(r'\{.*?\}', response, re.DOTALL)
                 if json_match:
-                    event = json.loads(json_match.group(0))
+                    event = _loads(json_match.group(0))
                     if isinstance(event, dict):
                         logger.info("Extracted single event from markdown")
                         return [event]
@@ -1831,31 +2159,47 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON ARRAY.
         """
         try:
             # Try direct JSON parse first
-            return json.loads(response)
+            return _loads(response)
         except json.JSONDecodeError:
             # Try to extract JSON from markdown
             try:
                 import re
                 json_match = re.search(r'\{.*?\}', response, re.DOTALL)
                 if json_match:
-                    return json.loads(json_match.group(0))
+                    return _loads(json_match.group(0))
             except Exception:
                 pass
             
             logger.warning("Failed to parse JSON from response")
             return None
     
+    @staticmethod
+    def _average_relevance(sources: List[Dict[str, Any]]) -> Optional[float]:
+        """
+        Average relevance score of source articles.
+        
+        Args:
+            sources: List of source articles
+            
+        Returns:
+            Mean relevance score, or None if there are no sources
+        """
+        if not sources:
+            return None
+        return sum(s.get("relevance_score", 0.5) for s in sources) / len(sources)
+    
     def _calculate_event_credibility(
         self, 
         event: Dict[str, Any], 
-        sources: List[Dict[str, Any]]
+        source_quality: Optional[float]
     ) -> float:
         """
         Calculate credibility score for an event based on sources and content.
         
         Args:
             event: Event dictionary
-            sources: List of source articles
+            source_quality: Average relevance of the source articles, from
+                _average_relevance; None if there were no sources
             
         Returns:
             Credibility score from 0-10
@@ -1883,13 +2227,32 @@ DO NOT OUTPUT ANYTHING EXCEPT THE JSON ARRAY.
         score += min(len(actors) * 0.33, 1.0)
         
         # Factor 6: Source quality from original articles (max +1.5)
-        if sources:
-            avg_relevance = sum(s.get("relevance_score", 0.5) for s in sources) / len(sources)
-            score += avg_relevance * 1.5
+        if source_quality is not None:
+            score += source_quality * 1.5
         
         # Ensure score is between 0 and 10
         return round(min(max(score, 0.0), 10.0), 1)
     
+    def _event_to_source(self, event: Dict[str, Any], url: str) -> Source:
+        """
+        Describe a discovered event as a Source.
+        
+        Args:
+            event: Event dictionary
+            url: One of the event's source URLs
+            
+        Returns:
+            Source with the event as its summary
+        """
+        return Source(
+            url=url,
+            title=event.get("event", "Event"),
+            publication=self._extract_publication_from_url(url),
+            credibility_score=event.get("credibility_score", 5.0) / 10.0,  # Convert 0-10 to 0-1
+            content_summary=self._format_event_as_summary(event),
+            published_date=datetime.utcnow()
+        )
+    
     def _format_event_as_summary(self, event: Dict[str, Any]) -> str:
         """
         Format an event dictionary as a content summary for Source objects.
@@ -2333,16 +2696,16 @@ Host: Welcome to this segment{topic_text}.
         ]
         
         # Find the next segment boundary
-                end_idx = len(response)
+        end_idx = len(response)
         for marker in all_segment_markers:
             if marker == marker_found:
                 continue  # Skip our current marker
             next_idx = response_lower.find(marker, start_idx + len(marker_found) + 20)
-                    if next_idx > start_idx and next_idx < end_idx:
-                        end_idx = next_idx
-                
+            if next_idx > start_idx and next_idx < end_idx:
+                end_idx = next_idx
+        
         # Extract the content
-                content = response[start_idx:end_idx].strip()
+        content = response[start_idx:end_idx].strip()
         
         # Remove the segment header/marker from content
         lines = content.split('\n')
@@ -0,0 +1,117 @@
+"""
+Tests for ClaudePodcastService web fetching.
+
+Sites are mocked with httpx.MockTransport, so no network access or API key is needed.
+Run from backend/ with: pytest podcast_generation/tests
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from podcast_generation.claude_service import ClaudePodcastService
+
+PAGE = "<html><body><p>" + "Feedcast fetch test content. " * 20 + "</p></body></html>"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff's retry delays instead of waiting them out."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds, *args, **kwargs):
+        delays.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def mock_service(responses):
+    """A service whose fetches are answered, in order, by `responses`; returns it and the request log."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    service = ClaudePodcastService(api_key="test-key")
+    service.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service, requests
+
+
+async def test_web_fetch_retries_server_error(sleeps):
+    """A 503 is retried and the following 200 is returned."""
+    service, requests = mock_service([
+        httpx.Response(503),
+        httpx.Response(200, headers={"content-type": "text/html"}, text=PAGE),
+    ])
+
+    result = await service.web_fetch("https://example.com/article")
+
+    assert len(requests) == 2
+    assert result["success"]
+    assert "Feedcast fetch test content." in result["content"]
+
+
+async def test_web_fetch_honors_retry_after(sleeps):
+    """A 429's Retry-After stretches the retry delay past the backoff default."""
+    service, requests = mock_service([
+        httpx.Response(429, headers={"retry-after": "7"}),
+        httpx.Response(200, headers={"content-type": "text/html"}, text=PAGE),
+    ])
+
+    result = await service.web_fetch("https://example.com/limited")
+
+    assert len(requests) == 2
+    assert result["success"]
+    assert len(sleeps) == 1 and sleeps[0] >= 7
+
+
+async def test_web_fetch_does_not_retry_client_error(sleeps):
+    """A 404 fails fast with a failure result instead of raising."""
+    service, requests = mock_service([httpx.Response(404)])
+
+    result = await service.web_fetch("https://example.com/missing")
+
+    assert len(requests) == 1
+    assert not result["success"]
+    assert result["error"] == "HTTP 404"
+    assert sleeps == []
+
+
+async def test_web_fetch_many_times_out_slow_fetch():
+    """A fetch running past `timeout` yields TimeoutError without holding up the rest."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/slow":
+            await asyncio.Event().wait()
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=PAGE)
+
+    service = ClaudePodcastService(api_key="test-key")
+    service.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    slow, fast = await service.web_fetch_many(
+        ["https://slow.example.com/slow", "https://fast.example.com/fast"],
+        timeout=0.05
+    )
+
+    assert isinstance(slow, asyncio.TimeoutError)
+    assert fast["success"]
+
+
+async def test_web_fetch_many_forgets_idle_hosts():
+    """Per-host limits only exist while a fetch to that host is in flight."""
+    service, requests = mock_service([
+        httpx.Response(200, headers={"content-type": "text/html"}, text=PAGE)
+        for _ in range(3)
+    ])
+
+    results = await service.web_fetch_many([
+        "https://a.example.com/1", "https://a.example.com/2", "https://b.example.com/1"
+    ])
+
+    assert all(result["success"] for result in results)
+    assert service._host_semaphores == {}
+    assert not service._host_fetches
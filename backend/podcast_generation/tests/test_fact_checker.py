@@ -0,0 +1,208 @@
+"""
+Tests for FactChecker.
+
+Claude is replaced by a stub generate_completion that answers by prompt type,
+so no network access or API key is needed.
+Run from backend/ with: pytest podcast_generation/tests
+"""
+
+import asyncio
+import json
+
+import anthropic
+import httpx
+import pytest
+
+from podcast_generation import fact_checker as fact_checker_module
+from podcast_generation.fact_checker import FactChecker
+from podcast_generation.types import FactCheck, Source, VerificationStatus
+
+SOURCES = [
+    Source(
+        url=f"https://example.com/{i}",
+        title=f"Source {i}",
+        publication="Example News",
+        credibility_score=0.8,
+        content_summary=f"Summary of source {i}."
+    )
+    for i in range(3)
+]
+
+
+def verdict(status="verified", confidence="high", **fields):
+    """A verdict as Claude returns it."""
+    return {
+        "confidence": confidence,
+        "verification_status": status,
+        "supporting_sources": [0],
+        "contradicting_sources": [],
+        "notes": "Stub verdict",
+        **fields
+    }
+
+
+class StubClaude:
+    """Answers generate_completion by prompt type and records each call's kind."""
+
+    def __init__(self, extract=None, fused=None, batch=None):
+        self.extract = extract
+        self.fused = fused
+        self.batch = batch
+        self.calls = []
+
+    async def generate_completion(self, messages, max_tokens=4000, temperature=0.7, system_prompt=None, **kwargs):
+        content = messages[-1]["content"]
+        if content.startswith("CLAIMS TO VALIDATE"):
+            claims = json.loads(content.split("\n", 1)[1].split("\n\n", 1)[0])
+            self.calls.append(("batch", [item["claim"] for item in claims]))
+            return await self._answer(self.batch, claims)
+        if "and validate each claim" in content:
+            self.calls.append(("fused", None))
+            return await self._answer(self.fused)
+        self.calls.append(("extract", None))
+        return await self._answer(self.extract)
+
+    @staticmethod
+    async def _answer(response, *args):
+        if callable(response):
+            response = response(*args)
+            if asyncio.iscoroutine(response):
+                response = await response
+        if isinstance(response, BaseException):
+            raise response
+        return response if isinstance(response, str) else json.dumps(response)
+
+
+def auth_error():
+    """An AuthenticationError like the SDK raises on a bad API key."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    return anthropic.AuthenticationError(
+        "invalid x-api-key", response=httpx.Response(401, request=request), body=None
+    )
+
+
+async def test_batch_verdicts_map_by_claim_index():
+    """Verdicts are matched to claims by claim_index, not response order; skipped claims fall back."""
+    claude = StubClaude(batch=[
+        verdict("disputed", "low", claim_index=2),
+        verdict("verified", "high", claim_index=0),
+        verdict("verified", "high", claim_index=7),  # Out of range: ignored
+    ])
+
+    fact_checks = await FactChecker(claude).validate_claims_batch(["First", "Second", "Third"], SOURCES)
+
+    assert [fc.claim for fc in fact_checks] == ["First", "Second", "Third"]
+    assert fact_checks[0].verification_status is VerificationStatus.VERIFIED
+    assert fact_checks[1].verification_status is VerificationStatus.UNVERIFIED
+    assert fact_checks[1].confidence == 0.0
+    assert fact_checks[1].sources == SOURCES
+    assert fact_checks[2].verification_status is VerificationStatus.DISPUTED
+
+
+async def test_verdict_cache_skips_repeat_validations():
+    """A claim already validated against the same sources is not sent to Claude again."""
+    claude = StubClaude(batch=lambda claims: [verdict(claim_index=item["claim_index"]) for item in claims])
+    checker = FactChecker(claude)
+
+    await checker.validate_claims_batch(["First", "Second"], SOURCES)
+    fact_checks = await checker.validate_claims_batch(["Second", "Third"], SOURCES)
+
+    assert claude.calls == [("batch", ["First", "Second"]), ("batch", ["Third"])]
+    assert all(fc.verification_status is VerificationStatus.VERIFIED for fc in fact_checks)
+
+
+async def test_fused_path_drops_duplicate_claims():
+    """extract_and_validate keeps the first of claims differing only in case or punctuation."""
+    claude = StubClaude(fused={"results": [
+        verdict(claim="Rates rose 2% in May."),
+        verdict(claim="rates rose 2% in may"),
+        verdict(claim="Unemployment fell.", status="partially_verified", confidence="medium"),
+    ]})
+
+    fact_checks = await FactChecker(claude).validate_all_claims(SOURCES)
+
+    assert claude.calls == [("fused", None)]
+    assert sorted(fc.claim for fc in fact_checks) == ["Rates rose 2% in May.", "Unemployment fell."]
+
+
+async def test_fused_failure_falls_back_to_two_stage_path():
+    """An unparseable fused response falls back to extracting, then batch-validating."""
+    claude = StubClaude(
+        fused="Sorry, here are some thoughts instead of JSON.",
+        extract=["Claim one", "Claim two"],
+        batch=lambda claims: [verdict(claim_index=item["claim_index"]) for item in claims]
+    )
+
+    fact_checks = await FactChecker(claude).validate_all_claims(SOURCES)
+
+    assert [kind for kind, _ in claude.calls] == ["fused", "extract", "batch"]
+    assert sorted(fc.claim for fc in fact_checks) == ["Claim one", "Claim two"]
+
+
+async def test_two_stage_path_validates_duplicates_once():
+    """Duplicate extracted claims are validated once and re-expanded with their own wording."""
+    claude = StubClaude(
+        extract=["The bill passed.", "the bill passed", "Turnout hit a record."],
+        batch=lambda claims: [verdict(claim_index=item["claim_index"]) for item in claims]
+    )
+
+    fact_checks = await FactChecker(claude).validate_all_claims(SOURCES, fused=False)
+
+    assert claude.calls[1] == ("batch", ["The bill passed.", "Turnout hit a record."])
+    assert sorted(fc.claim for fc in fact_checks) == ["The bill passed.", "Turnout hit a record.", "the bill passed"]
+
+
+async def test_fatal_error_is_not_masked_by_fused_fallback():
+    """An authentication failure in the fused call propagates instead of retrying two-stage."""
+    claude = StubClaude(fused=auth_error())
+
+    with pytest.raises(anthropic.AuthenticationError):
+        await FactChecker(claude).validate_all_claims(SOURCES)
+
+    assert claude.calls == [("fused", None)]
+
+
+async def test_fatal_error_cancels_sibling_batches(monkeypatch):
+    """A fatal error in one batch cancels the batches still waiting on Claude."""
+    monkeypatch.setattr(fact_checker_module, "CLAIM_BATCH_SIZE", 1)
+    cancelled = asyncio.Event()
+
+    async def batch(claims):
+        if claims[0]["claim"] == "Fatal":
+            raise auth_error()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    claude = StubClaude(extract=["Slow", "Fatal"], batch=batch)
+
+    with pytest.raises(anthropic.AuthenticationError):
+        await asyncio.wait_for(FactChecker(claude).validate_all_claims(SOURCES, fused=False), timeout=5)
+
+    assert cancelled.is_set()
+
+
+async def test_vectorized_summary_matches_python_loop(monkeypatch):
+    """The NumPy summary gives the same statistics as the pure-Python loop."""
+    pytest.importorskip("numpy")
+    statuses = list(VerificationStatus)
+    fact_checks = [
+        FactCheck(
+            claim=f"Claim {i}",
+            confidence=(i % 10) / 10,
+            verification_status=statuses[i % len(statuses)],
+            sources=SOURCES
+        )
+        for i in range(fact_checker_module.VECTORIZED_SUMMARY_MIN_CLAIMS + 6)
+    ]
+    checker = FactChecker(StubClaude())
+
+    vectorized = await checker.get_validation_summary(fact_checks)
+    monkeypatch.setattr(fact_checker_module, "np", None)
+    looped = await checker.get_validation_summary(fact_checks)
+
+    vectorized.pop("generated_at")
+    looped.pop("generated_at")
+    assert vectorized == looped
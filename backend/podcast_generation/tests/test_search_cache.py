@@ -0,0 +1,35 @@
+"""
+Tests for SearchCache.get_or_compute.
+
+Run from backend/ with: pytest podcast_generation/tests
+"""
+
+from podcast_generation.generator import SearchCache
+
+
+async def test_get_or_compute_caches_empty_results():
+    """An empty result is a hit on the next lookup, not recomputed."""
+    cache = SearchCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return []
+
+    assert await cache.get_or_compute("search:nothing", compute) == []
+    assert await cache.get_or_compute("search:nothing", compute) == []
+    assert len(calls) == 1
+
+
+async def test_get_or_compute_does_not_cache_none():
+    """None means "no value", so it is recomputed on the next lookup."""
+    cache = SearchCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return None
+
+    await cache.get_or_compute("fetch:failed", compute)
+    await cache.get_or_compute("fetch:failed", compute)
+    assert len(calls) == 2
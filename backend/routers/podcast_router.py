@@ -4,6 +4,7 @@ Provides comprehensive API endpoints for podcast creation, management, and user
 """
 
 import logging
+import traceback
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
@@ -16,9 +17,9 @@ from podcast_generation.types import (
     GenerationRequest, UserPreferences, Source, FactCheck, 
     LiveKitScript, PodcastSegmentRequest, SegmentType, Format
 )
-from podcast_generation.generator import PodcastGenerator
-from podcast_generation.claude_service import ClaudePodcastService
-from podcast_generation.fact_checker import FactChecker
+from podcast_generation.generator import PodcastGenerator, get_search_cache
+from podcast_generation.claude_service import ClaudePodcastService, get_claude_service
+from podcast_generation.fact_checker import FactChecker, get_fact_checker
 from clean_agent.services.supabase_client import SupabaseClient
 
 # Configure logging
@@ -94,26 +95,18 @@ class UserInterestRequest(BaseModel):
 # Dependency injection
 async def get_supabase_client():
     """Get Supabase client instance."""
-    client = SupabaseClient()
+    client = SupabaseClient.get()
     if not client.is_connected():
         raise HTTPException(status_code=500, detail="Database connection failed")
     return client.client
 
-async def get_claude_service():
-    """Get Claude service instance."""
-    return ClaudePodcastService()
-
-async def get_fact_checker(claude_service: ClaudePodcastService = Depends(get_claude_service)):
-    """Get FactChecker instance."""
-    return FactChecker(claude_service)
-
 async def get_podcast_generator(
     supabase_client = Depends(get_supabase_client),
     claude_service: ClaudePodcastService = Depends(get_claude_service),
     fact_checker: FactChecker = Depends(get_fact_checker)
 ):
-    """Get PodcastGenerator instance."""
-    return PodcastGenerator(supabase_client, claude_service, fact_checker)
+    """Get PodcastGenerator instance, sharing the process-wide search cache."""
+    return PodcastGenerator(supabase_client, claude_service, fact_checker, get_search_cache())
 
 # Background task for podcast generation
 async def generate_news_podcast_background(
@@ -144,7 +137,6 @@ async def generate_news_podcast_background(
         
     except Exception as e:
         logger.error(f"❌ NEWS episode generation failed for user {user_id}: {str(e)}")
-        import traceback
         logger.error(traceback.format_exc())
 
 
@@ -297,7 +289,6 @@ async def generate_personalized_news_podcast(
         raise
     except Exception as e:
         logger.error(f"Failed to start news podcast generation: {str(e)}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to start podcast generation: {str(e)}")
 
@@ -359,7 +350,6 @@ async def generate_podcast(
     except Exception as e:
         logger.error(f"Failed to start podcast generation: {str(e)}")
         logger.error(f"Exception type: {type(e).__name__}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to start podcast generation: {str(e)}")
 
@@ -664,6 +654,30 @@ async def add_user_interest(
         logger.error(f"Failed to add/update interest for user {user_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to update user interest")
 
+async def prewarm_background(generator: PodcastGenerator, user_id: str):
+    """Background task that researches a user's top interests into the search cache."""
+    try:
+        warmed = await generator.prewarm(user_id)
+        logger.info(f"Prewarmed {warmed} topic(s) for user {user_id}")
+    except Exception as e:
+        logger.error(f"Prewarm failed for user {user_id}: {str(e)}")
+
+@router.post("/users/{user_id}/prewarm", status_code=202)
+async def prewarm_user_research(
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    generator: PodcastGenerator = Depends(get_podcast_generator)
+):
+    """
+    Warm the research cache for a user's top interests.
+
+    Call ahead of an expected generation (e.g. when the app opens). Research
+    runs after the response is sent, so a following generate request on the
+    same topics starts from cached searches and fetches.
+    """
+    background_tasks.add_task(prewarm_background, generator, user_id)
+    return {"success": True, "message": "Prewarm scheduled", "user_id": user_id}
+
 # Health check endpoint
 @router.get("/podcasts/health")
 async def health_check():